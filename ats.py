@@ -0,0 +1,298 @@
+# ----- IMPORTAÇÕES -----
+import argparse
+import heapq
+import json
+import math
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass
+from functools import lru_cache
+from fileio import iter_records
+from models import Resume, split_skills
+
+# Comparação de currículos com vagas (palavras-chave de ATS), apenas com a
+# biblioteca padrão e sem depender do ReportLab.
+#
+# As vagas são indexadas uma única vez em um índice invertido (termo -> vagas que o
+# contêm). Os termos são palavras normalizadas (minúsculas, sem acentos) e, para as
+# palavras-chave explícitas das vagas, expressões de até max_phrase_len palavras
+# ("gestão de projetos"). Cada currículo é comparado percorrendo apenas as listas
+# dos termos que ele contém, em tempo proporcional ao tamanho do currículo e às
+# ocorrências desses termos, em vez de comparar o texto com cada vaga.
+#
+#   python ats.py vagas.jsonl curriculo.json --top 5
+#   python ats.py vagas.jsonl registros.jsonl > resultados.jsonl
+
+# Palavras ignoradas na indexação e na comparação (já sem acentos).
+STOPWORDS = frozenset("""
+    a ao aos as ate com como da das de do dos e em entre era essa esse esta este eu foi ha isso ja
+    mais mas na nao nas no nos o os ou para pela pelas pelo pelos por que se sem ser seu seus sob
+    sobre sua suas tambem tem ter um uma umas uns voce
+    an and are as at be by for from in is it of on or our that the this to we will with you your
+""".split())
+
+# Peso extra de uma palavra-chave listada explicitamente na vaga ("palavras_chave"),
+# em relação a um termo que apenas aparece no título ou na descrição.
+KEYWORD_WEIGHT = 3.0
+
+# Palavras: letras e dígitos, com pontos e hífens internos (node.js, full-stack) e
+# sufixos + ou # (c++, c#).
+_TOKEN_RE = re.compile(r"[^\W_]+(?:[.\-][^\W_]+)*[+#]*")
+
+
+# ----- NORMALIZAÇÃO -----
+@lru_cache(maxsize=65536)
+def fold(word):
+    """Remove os acentos de uma palavra já em minúsculas ("gestão" -> "gestao")."""
+    decomposed = unicodedata.normalize("NFKD", word)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text, display=None):
+    """
+    Separa o texto em termos normalizados (minúsculas, sem acentos, sem stopwords).
+
+    Args:
+        text (str): O texto.
+        display (dict, opcional): Recebe, para cada termo novo, a forma original
+            (em minúsculas, com acentos), usada para exibir as palavras-chave.
+
+    Returns:
+        list: Os termos, na ordem em que aparecem.
+    """
+    terms = []
+    for word in _TOKEN_RE.findall(text.casefold()):
+        term = fold(word)
+        if term in STOPWORDS:
+            continue
+        terms.append(term)
+        if display is not None and term not in display:
+            display[term] = word
+    return terms
+
+
+def ngrams(terms, max_n):
+    """Gera os termos e as expressões de 2 a max_n termos consecutivos."""
+    for n in range(1, max_n + 1):
+        for start in range(len(terms) - n + 1):
+            yield " ".join(terms[start:start + n])
+
+
+def resume_texts(resume):
+    """
+    Retorna os textos do currículo usados na comparação: resumo, cargos e descrições
+    das experiências, cursos e cada habilidade separadamente.
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    texts = [resume.resumo]
+    for exp in resume.experiencias:
+        texts += (exp.cargo, exp.descricao)
+    for edu in resume.educacao:
+        texts += (edu.curso, edu.detalhes_edu)
+    texts += split_skills(resume.habilidades)
+    return [text for text in texts if text]
+
+
+def resume_terms(resume, max_n=1):
+    """Retorna o conjunto de termos e expressões (até max_n palavras) do currículo."""
+    terms = set()
+    # As expressões não atravessam campos: o fim de uma habilidade e o início da
+    # seguinte não formam uma expressão.
+    for text in resume_texts(resume):
+        terms.update(ngrams(tokenize(text), max_n))
+    return terms
+
+
+def _keywords(value):
+    """Lista de palavras-chave de uma vaga: lista JSON ou texto separado por vírgulas."""
+    if isinstance(value, str):
+        return split_skills(value)
+    return [str(item) for item in value or ()]
+
+
+# ----- ÍNDICE DE VAGAS -----
+@dataclass(frozen=True, slots=True)
+class Match:
+    """Resultado da comparação de um currículo com uma vaga."""
+    id: str
+    titulo: str
+    pontuacao: float
+    presentes: tuple
+    ausentes: tuple
+
+    def to_dict(self):
+        return {"id": self.id, "titulo": self.titulo, "pontuacao": round(self.pontuacao, 4),
+                "presentes": list(self.presentes), "ausentes": list(self.ausentes)}
+
+
+class PostingIndex:
+    """Índice invertido de vagas, para comparar muitos currículos com muitas vagas."""
+
+    def __init__(self, max_phrase_len=4):
+        """
+        Args:
+            max_phrase_len (int): Número máximo de palavras de uma palavra-chave explícita
+                indexada como expressão; palavras-chave mais longas são indexadas
+                apenas palavra a palavra.
+        """
+        self.max_phrase_len = max_phrase_len
+        self.ids = []
+        self.titles = []
+        self._terms = []     # por vaga: termo -> multiplicador (1 ou KEYWORD_WEIGHT)
+        self._explicit = []  # por vaga: termos das palavras-chave explícitas
+        self._index = {}     # termo -> números das vagas que o contêm
+        self._display = {}   # termo -> forma original, para exibição
+        self._weights = None
+        self._postings = None
+        self._totals = None
+        self._phrase_len = 1
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, posting):
+        """
+        Indexa uma vaga.
+
+        Args:
+            posting (dict): "id", "titulo", "descricao" e, opcionalmente, "palavras_chave"
+                (lista ou texto separado por vírgulas).
+        """
+        number = len(self.ids)
+        titulo = str(posting.get("titulo") or "").strip()
+        terms = dict.fromkeys(tokenize(f"{titulo}\n{posting.get('descricao') or ''}", self._display), 1.0)
+        phrase_words = set()
+        explicit = set()
+        for keyword in _keywords(posting.get("palavras_chave")):
+            words = tokenize(keyword, self._display)
+            if len(words) > self.max_phrase_len:
+                terms.update(dict.fromkeys(words, KEYWORD_WEIGHT))
+                explicit.update(words)
+            elif words:
+                phrase = " ".join(words)
+                terms[phrase] = KEYWORD_WEIGHT
+                explicit.add(phrase)
+                self._display.setdefault(phrase, keyword.strip().casefold())
+                self._phrase_len = max(self._phrase_len, len(words))
+                if len(words) > 1:
+                    phrase_words.update(words)
+        # Uma expressão conta uma única vez: "análise de dados" já cobre "análise" e "dados".
+        for word in phrase_words:
+            if terms.get(word) == 1.0:
+                del terms[word]
+
+        self.ids.append(str(posting.get("id") or number + 1))
+        self.titles.append(titulo)
+        self._terms.append(terms)
+        self._explicit.append(frozenset(explicit))
+        for term in terms:
+            self._index.setdefault(term, []).append(number)
+        self._postings = None
+
+    @classmethod
+    def from_postings(cls, postings, **kwargs):
+        """Cria o índice a partir de um iterável de vagas (dicionários)."""
+        index = cls(**kwargs)
+        for posting in postings:
+            index.add(posting)
+        return index
+
+    def _finalize(self):
+        """
+        Calcula o peso (IDF) dos termos e o peso total de cada vaga, após a indexação.
+
+        Cada termo passa a ter duas listas paralelas (vagas e pesos), percorridas
+        diretamente na comparação.
+        """
+        total = len(self.ids)
+        idf = {term: math.log(1 + total / len(numbers)) for term, numbers in self._index.items()}
+        self._weights = [{term: idf[term] * factor for term, factor in terms.items()} for terms in self._terms]
+        self._totals = [sum(weights.values()) or 1.0 for weights in self._weights]
+        self._postings = {term: (numbers, [self._weights[number][term] for number in numbers])
+                          for term, numbers in self._index.items()}
+
+    def match(self, resume, top=10, missing=10):
+        """
+        Classifica as vagas mais aderentes a um currículo.
+
+        A pontuação é a fração (de 0 a 1) do peso das palavras da vaga presentes no
+        currículo; termos raros no conjunto de vagas e palavras-chave explícitas pesam mais.
+
+        Args:
+            resume (Resume | dict): O currículo.
+            top (int): Número de vagas retornadas.
+            missing (int): Número máximo de palavras-chave ausentes listadas por vaga,
+                das mais importantes para as menos. Se a vaga tiver palavras-chave
+                explícitas, apenas elas são listadas; as palavras da descrição contam
+                só na pontuação.
+
+        Returns:
+            list: Objetos Match, da vaga mais aderente para a menos aderente.
+        """
+        if self._postings is None:
+            self._finalize()
+        totals = self._totals
+        terms = resume_terms(resume, self._phrase_len)
+
+        # Apenas as vagas com algum termo em comum recebem pontuação.
+        scores = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is not None:
+                for number, weight in zip(*postings):
+                    scores[number] = scores.get(number, 0.0) + weight
+        best = heapq.nlargest(top, scores, key=lambda number: (scores[number] / totals[number], -number))
+
+        matches = []
+        for number in best:
+            ranked = sorted(self._weights[number].items(), key=lambda item: -item[1])
+            explicit = self._explicit[number]
+            present = [self._display[term] for term, _ in ranked if term in terms]
+            absent = [self._display[term] for term, _ in ranked
+                      if term not in terms and (not explicit or term in explicit)][:missing]
+            matches.append(Match(self.ids[number], self.titles[number], scores[number] / totals[number],
+                                 tuple(present), tuple(absent)))
+        return matches
+
+    def match_many(self, resumes, top=10, missing=10):
+        """Compara cada currículo de um iterável; gera uma lista de Match por currículo."""
+        for resume in resumes:
+            yield self.match(resume, top, missing)
+
+
+# ----- LINHA DE COMANDO -----
+def main(argv=None):
+    """Compara um ou vários currículos com um arquivo de vagas e imprime os resultados em JSONL."""
+    parser = argparse.ArgumentParser(description="Compara currículos com vagas (palavras-chave de ATS).")
+    parser.add_argument("postings", help="Vagas em JSONL ou CSV (id, titulo, descricao, palavras_chave).")
+    parser.add_argument("resumes", help="Currículo em .json, ou vários em .jsonl/.csv (mesmo formato do modo em lote).")
+    parser.add_argument("--top", type=int, default=10, help="Vagas listadas por currículo (padrão: %(default)s).")
+    parser.add_argument("--missing", type=int, default=10, help="Palavras-chave ausentes listadas por vaga (padrão: %(default)s).")
+    args = parser.parse_args(argv)
+
+    index = PostingIndex()
+    for number, posting, error in iter_records(args.postings):
+        if error:
+            print(f"Vaga {number} ignorada: {error}", file=sys.stderr)
+        else:
+            index.add(posting)
+
+    if args.resumes.lower().endswith(".json"):
+        with open(args.resumes, encoding="utf-8") as f:
+            records = [(1, json.load(f), None)]
+    else:
+        records = iter_records(args.resumes)
+
+    for number, record, error in records:
+        if error:
+            entry = {"registro": number, "erro": error}
+        else:
+            entry = {"registro": number, "vagas": [m.to_dict() for m in index.match(record, args.top, args.missing)]}
+        print(json.dumps(entry, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
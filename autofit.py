@@ -0,0 +1,160 @@
+# ----- IMPORTAÇÕES -----
+import io
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from reportlab import rl_config
+from engine import CUSTOM_STYLE_NAMES, Resume, build_story, get_styles, make_doc_template, render
+
+# Ajuste automático a N páginas: encontra a maior escala de fonte, entrelinha e
+# espaçamento dos estilos do currículo que ainda cabe no número de páginas
+# desejado. Cada tentativa apenas mede os flowables com wrap()/split(), sem
+# gerar o PDF; só a renderização final chama doc.build.
+
+# Atributos dos estilos multiplicados pela escala.
+SCALED_ATTRIBUTES = ("fontSize", "leading", "spaceBefore", "spaceAfter", "bulletFontSize")
+# Padding padrão do Frame do SimpleDocTemplate (pontos, em cada lado).
+FRAME_PADDING = 6
+
+
+@dataclass(frozen=True, slots=True)
+class FitResult:
+    """Resultado do ajuste: escala escolhida, páginas estimadas e os estilos correspondentes."""
+    scale: float
+    pages: int
+    fits: bool
+    styles: MappingProxyType
+
+
+@lru_cache(maxsize=64)
+def scaled_styles(scale, font_family=None):
+    """
+    Retorna os estilos do currículo com tamanhos e espaçamentos multiplicados por scale.
+
+    Os resultados são guardados por escala (arredondada a 0,01), de modo que o
+    cache de flowables continua válido entre ajustes repetidos.
+    """
+    base = get_styles(font_family)
+    styles = dict(base)
+    for name in CUSTOM_STYLE_NAMES:
+        style = base[name].clone(name)
+        for attribute in SCALED_ATTRIBUTES:
+            setattr(style, attribute, getattr(base[name], attribute) * scale)
+        styles[name] = style
+    return MappingProxyType(styles)
+
+
+def frame_size():
+    """Largura e altura úteis do frame de cada página do currículo."""
+    doc = make_doc_template(io.BytesIO())
+    return doc.width - 2 * FRAME_PADDING, doc.height - 2 * FRAME_PADDING
+
+
+def count_pages(story, width, height):
+    """
+    Estima o número de páginas da story reproduzindo o preenchimento do Frame do Platypus.
+
+    Mede cada flowable com wrap() e, quando ele não cabe no espaço restante,
+    tenta dividi-lo com split(), como o SimpleDocTemplate faz; nada é desenhado.
+
+    Args:
+        story (list): Flowables (são modificados pela medição; não os reutilize no build).
+        width (float): Largura útil do frame.
+        height (float): Altura útil do frame.
+
+    Returns:
+        int: Número estimado de páginas.
+    """
+    pages = 1
+    y = height
+    at_top = True
+    previous_space_after = 0
+    pending = list(reversed(story))
+    while pending:
+        flowable = pending.pop()
+        space_before = 0 if at_top else max(flowable.getSpaceBefore() - previous_space_after, 0)
+        available = y - space_before
+        if available > 0:
+            _, h = flowable.wrap(width, available)
+            if h <= available + rl_config._FUZZ:
+                previous_space_after = flowable.getSpaceAfter()
+                y = available - h - previous_space_after
+                at_top = False
+                continue
+            parts = flowable.split(width, available)
+            if len(parts) > 1:
+                pending.extend(reversed(parts))
+                continue
+        if at_top:
+            # Não cabe nem em uma página vazia: ocupa a página inteira
+            y = 0
+            at_top = False
+            continue
+        pages += 1
+        y = height
+        at_top = True
+        previous_space_after = 0
+        pending.append(flowable)
+    return pages
+
+
+def fit_to_pages(resume, max_pages=1, min_scale=0.7, max_scale=1.0, font_family=None):
+    """
+    Encontra, por busca binária, a maior escala dos estilos que cabe em max_pages páginas.
+
+    Args:
+        resume (Resume | dict): Os dados do currículo.
+        max_pages (int): Número máximo de páginas.
+        min_scale (float): Menor escala aceitável.
+        max_scale (float): Maior escala tentada (1.0 mantém o tamanho original).
+        font_family (str, opcional): Família registrada com engine.register_font_family.
+
+    Returns:
+        FitResult: A escala escolhida; se nem min_scale couber, fits é False e
+            a escala é min_scale.
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    width, height = frame_size()
+
+    def pages_at(scale):
+        return count_pages(build_story(resume, scaled_styles(scale, font_family)), width, height)
+
+    def result(scale, pages):
+        return FitResult(scale=scale, pages=pages, fits=pages <= max_pages, styles=scaled_styles(scale, font_family))
+
+    pages = pages_at(max_scale)
+    if pages <= max_pages:
+        return result(max_scale, pages)
+    low_pages = pages_at(min_scale)
+    if low_pages > max_pages:
+        return result(min_scale, low_pages)
+
+    # Invariante: low cabe, high não cabe; escalas arredondadas a 0,01
+    low, high = min_scale, max_scale
+    while high - low > 0.01 + 1e-9:
+        middle = round((low + high) / 2, 2)
+        if middle in (low, high):
+            break
+        pages = pages_at(middle)
+        if pages <= max_pages:
+            low, low_pages = middle, pages
+        else:
+            high = middle
+    return result(low, low_pages)
+
+
+def render_fitted(resume, out, max_pages=1, min_scale=0.7, max_scale=1.0, font_family=None, **kwargs):
+    """
+    Gera o PDF com a maior escala que cabe em max_pages páginas.
+
+    Os demais argumentos (progress, cancel, cache) são repassados a engine.render.
+
+    Returns:
+        FitResult: O resultado do ajuste usado na renderização.
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    fit = fit_to_pages(resume, max_pages, min_scale, max_scale, font_family)
+    render(resume, out, fit.styles, **kwargs)
+    return fit
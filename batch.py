@@ -0,0 +1,231 @@
+# ----- IMPORTAÇÕES -----
+import contextlib
+import io
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from engine import Resume, get_styles, render
+from export import export, format_extension
+from fileio import atomic_write, iter_records
+from instrumentation import Instrumentation, JsonLinesWriter
+from render_cache import RenderCache, render_cached
+
+# Geração de currículos em lote: lê registros de um arquivo JSONL ou CSV de forma
+# incremental e distribui as chamadas de SimpleDocTemplate.build entre processos,
+# com um limite de tarefas pendentes para manter o uso de memória constante.
+
+# Cache em disco de cada processo de trabalho (None quando desativado).
+_worker_cache = None
+# Instrumentação de cada processo de trabalho (None quando desativada).
+_worker_instrumentation = None
+# Formatos gerados além do PDF (ex.: ("txt", "docx")).
+_worker_formats = ()
+
+
+# ----- NOMES DOS ARQUIVOS -----
+def output_name(number, record, used=None):
+    """
+    Gera o nome do PDF a partir do campo "id" do registro ou do seu número.
+
+    Args:
+        number (int): Número do registro no arquivo de entrada.
+        record (dict): O registro.
+        used (set, opcional): Nomes já atribuídos no lote (em minúsculas), atualizado
+            aqui. Um id repetido recebe o número do registro como sufixo
+            ("joao-000007.pdf"), para que um PDF não sobrescreva outro.
+    """
+    record_id = str(record.get("id") or "").strip()
+    record_id = re.sub(r"[^\w.-]+", "_", record_id).strip("._")
+    stem = record_id or f"{number:06d}"
+    if used is None:
+        return f"{stem}.pdf"
+    name, suffix = stem, 1
+    while name.casefold() in used:
+        name = f"{stem}-{number:06d}" + (f"-{suffix}" if suffix > 1 else "")
+        suffix += 1
+    used.add(name.casefold())
+    return f"{name}.pdf"
+
+
+# ----- PROCESSOS DE TRABALHO -----
+def _init_worker(cache_dir=None, cache_max_bytes=None, instrument=False, profile_slowest=0, profile_dir=None,
+                 formats=()):
+    """Prepara o registro de estilos, o cache em disco e a instrumentação uma única vez em cada processo de trabalho."""
+    global _worker_cache, _worker_instrumentation, _worker_formats
+    get_styles()
+    _worker_formats = tuple(formats)
+    if cache_dir:
+        _worker_cache = RenderCache(cache_dir, cache_max_bytes) if cache_max_bytes else RenderCache(cache_dir)
+    if instrument or profile_slowest:
+        _worker_instrumentation = Instrumentation(profile_slowest=profile_slowest, profile_dir=profile_dir)
+
+
+def _render_record(record, out_path, number=None):
+    """
+    Gera o PDF de um registro (executado em um processo de trabalho).
+
+    O arquivo é gravado em um nome temporário e renomeado ao final, para que
+    uma falha nunca deixe um PDF incompleto no diretório de saída.
+
+    Returns:
+        tuple: Tempo gasto na geração, em segundos, se o PDF veio do cache em disco
+            (None quando o cache está desativado) e o registro da instrumentação
+            (None quando desativada).
+    """
+    if _worker_instrumentation is None:
+        start = time.perf_counter()
+        hit = _render_to(Resume.from_dict(record), out_path)
+        return time.perf_counter() - start, hit, None
+
+    trace = None
+    try:
+        with _worker_instrumentation.trace(origem="lote", registro=number) as trace:
+            hit = _render_to(Resume.from_dict(record), out_path, trace)
+    except Exception as e:
+        # O registro acompanha a exceção até o processo principal, que o grava no trace.
+        e.trace = trace.record if trace is not None else None
+        raise
+    return trace.record["segundos"], hit, trace.record
+
+
+def _render_to(resume, out_path, trace=None):
+    """
+    Grava o PDF em out_path, pelo cache em disco quando ativado, e os formatos extras
+    ao lado dele; retorna o acerto do cache ou None.
+    """
+    if _worker_formats:
+        # Os outros formatos partem da mesma representação intermediária; o PDF
+        # continua passando pelo cache em disco, quando ativado.
+        base_path = os.path.splitext(out_path)[0]
+        if _worker_cache is None:
+            export(resume, ("pdf", *_worker_formats), base_path, {"pdf": {"trace": trace}})
+            return None
+        hit = render_cached(resume, out_path, _worker_cache, trace=trace)
+        export(resume, _worker_formats, base_path)
+        return hit
+    if _worker_cache is not None:
+        return render_cached(resume, out_path, _worker_cache, trace=trace)
+
+    buffer = io.BytesIO()
+    render(resume, buffer, trace=trace)
+    with trace.phase("write") if trace is not None else contextlib.nullcontext():
+        atomic_write(out_path, buffer.getvalue())
+    return None
+
+
+# ----- EXECUÇÃO DO LOTE -----
+def run_batch(input_path, output_dir, manifest_path=None, workers=None, max_in_flight=None, input_format=None,
+              cache_dir=None, cache_max_bytes=None, trace_path=None, profile_slowest=0, profile_dir=None,
+              formats=()):
+    """
+    Gera um PDF para cada registro do arquivo de entrada.
+
+    Um registro com erro é anotado no manifesto e não interrompe o restante do lote.
+
+    Args:
+        input_path (str): Arquivo .jsonl ou .csv com um currículo por registro.
+        output_dir (str): Diretório onde os PDFs serão gravados.
+        manifest_path (str, opcional): Manifesto JSONL com o resultado de cada registro;
+            padrão: "manifest.jsonl" dentro de output_dir.
+        workers (int, opcional): Número de processos; padrão: número de CPUs.
+        max_in_flight (int, opcional): Máximo de registros pendentes; padrão: 4 por processo.
+        input_format (str, opcional): "jsonl" ou "csv"; deduzido da extensão se omitido.
+        cache_dir (str, opcional): Diretório do cache em disco de PDFs (compartilhado
+            pelos processos); sem ele, todos os registros são renderizados.
+        cache_max_bytes (int, opcional): Tamanho máximo do cache em disco.
+        trace_path (str, opcional): Arquivo JSONL que recebe o registro de instrumentação
+            de cada PDF (fases, seções, flowables, páginas e bytes).
+        profile_slowest (int): Guarda o perfil cProfile das N renderizações mais lentas
+            de cada processo; 0 desativa.
+        profile_dir (str, opcional): Diretório dos perfis (.prof); padrão: "perfis"
+            dentro de output_dir.
+        formats (iterable): Formatos gerados além do PDF, com o mesmo nome de arquivo
+            (ex.: ("txt", "docx", "json")).
+
+    Returns:
+        dict: Contagem de registros gerados ("ok") e com falha ("erro").
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    if manifest_path is None:
+        manifest_path = os.path.join(output_dir, "manifest.jsonl")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    counts = {"ok": 0, "erro": 0}
+    if profile_slowest and profile_dir is None:
+        profile_dir = os.path.join(output_dir, "perfis")
+    formats = tuple(name for name in dict.fromkeys(formats) if name != "pdf")
+    extensions = [format_extension(name) for name in formats]
+    trace_writer = JsonLinesWriter(trace_path) if trace_path else None
+    initargs = (cache_dir, cache_max_bytes, trace_writer is not None, profile_slowest, profile_dir, formats)
+
+    def new_pool():
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs)
+
+    pool = new_pool()
+    with open(manifest_path, "w", encoding="utf-8") as manifest:
+
+        def write_entry(number, out_path, error=None, result=None):
+            if error:
+                entry = {"registro": number, "status": "erro", "arquivo": None, "erro": error}
+            else:
+                seconds, cache_hit, trace = result
+                if trace_writer is not None:
+                    trace_writer(dict(trace, arquivo=out_path))
+                entry = {"registro": number, "status": "ok", "arquivo": out_path, "segundos": round(seconds, 4)}
+                if extensions:
+                    entry["outros_arquivos"] = [os.path.splitext(out_path)[0] + ext for ext in extensions]
+                if cache_hit is not None:
+                    entry["cache"] = cache_hit
+            counts[entry["status"]] += 1
+            manifest.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+        def drain():
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                number, out_path = pending.pop(future)
+                try:
+                    write_entry(number, out_path, result=future.result())
+                except Exception as e:
+                    if trace_writer is not None and getattr(e, "trace", None):
+                        trace_writer(e.trace)
+                    write_entry(number, out_path, error=f"{type(e).__name__}: {e}")
+
+        def submit(record, out_path, number):
+            # Um processo que morre (ex.: falta de memória) quebra o pool: os registros
+            # pendentes são anotados com erro em drain() e um novo pool é criado.
+            nonlocal pool
+            try:
+                return pool.submit(_render_record, record, out_path, number)
+            except BrokenProcessPool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                pool = new_pool()
+                return pool.submit(_render_record, record, out_path, number)
+
+        pending = {}
+        used_names = set()
+        try:
+            for number, record, error in iter_records(input_path, input_format):
+                if error:
+                    write_entry(number, None, error=error)
+                    continue
+                out_path = os.path.join(output_dir, output_name(number, record, used_names))
+                try:
+                    pending[submit(record, out_path, number)] = (number, out_path)
+                except BrokenProcessPool as e:
+                    write_entry(number, out_path, error=f"{type(e).__name__}: {e}")
+                if len(pending) >= max_in_flight:
+                    drain()
+        finally:
+            # Mesmo se a leitura for interrompida, os registros já enviados entram no manifesto.
+            try:
+                while pending:
+                    drain()
+            finally:
+                pool.shutdown()
+
+    if trace_writer is not None:
+        trace_writer.close()
+    return counts
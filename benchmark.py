@@ -0,0 +1,345 @@
+# ----- IMPORTAÇÕES -----
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from engine import Resume, build_story, flowable_cache, make_doc_template, get_styles
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Suíte de benchmarks: gera currículos sintéticos de tamanho controlado, mede cada
+# fase (coleta dos dados da UI, montagem da story, doc.build, inicialização) e
+# compara com uma linha de base gravada, falhando quando alguma fase fica mais
+# lenta, o throughput cai ou o pico de memória cresce além do limite configurado.
+#
+#   python benchmark.py --profile grande --save-baseline benchmark_baseline.json
+#   python benchmark.py --profile grande --baseline benchmark_baseline.json --threshold 0.2
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Perfis de tamanho: (experiências, bullets por experiência, habilidades, formações)
+PROFILES = {
+    "pequeno": (2, 3, 8, 1),
+    "medio": (6, 6, 20, 2),
+    "grande": (20, 10, 60, 4),
+    "academico": (150, 4, 120, 10),
+}
+
+WORDS = ("desenvolvimento", "liderança", "análise", "sistemas", "projeto", "equipe", "resultados",
+         "implantação", "otimização", "clientes", "processos", "dados", "qualidade", "gestão")
+UNICODE_WORDS = ("São Paulo", "ação", "coração", "Müller", "Ørsted", "Łódź", "Ελληνικά", "naïve",
+                 "façade", "Ñandú", "Straße", "Čapek", "€ 1.000", "“aspas”", "—")
+
+
+# ----- GERADOR DE CURRÍCULOS SINTÉTICOS -----
+def synthetic_resume(experiences=6, bullets=6, skills=20, education=2, unicode=False, seed=0):
+    """
+    Gera um currículo sintético de tamanho controlado.
+
+    Args:
+        experiences (int): Número de experiências profissionais.
+        bullets (int): Bullet points por experiência.
+        skills (int): Número de habilidades.
+        education (int): Número de formações.
+        unicode (bool): Mistura palavras com acentos e alfabetos não latinos.
+        seed (int): Semente do gerador aleatório (resultados reproduzíveis).
+
+    Returns:
+        Resume: O currículo gerado.
+    """
+    rng = random.Random(seed)
+    words = WORDS + UNICODE_WORDS if unicode else WORDS
+
+    def sentence(count):
+        return " ".join(rng.choice(words) for _ in range(count)).capitalize()
+
+    return Resume.from_dict({
+        "nome_completo": "Maria da Conceição Ångström" if unicode else "Maria da Silva",
+        "email": "maria@example.com",
+        "telefone": "(11) 99999-0000",
+        "linkedin": "https://linkedin.com/in/maria",
+        "resumo": sentence(60),
+        "experiencias": [{
+            "cargo": sentence(3),
+            "empresa": sentence(2),
+            "local": "São Paulo, SP",
+            "data_inicio": f"01/{2000 + i % 20}",
+            "data_fim": "Atual" if i == 0 else f"12/{2001 + i % 20}",
+            "descricao": "\n".join(f"- {sentence(rng.randint(8, 25))}" for _ in range(bullets)),
+        } for i in range(experiences)],
+        "educacao": [{
+            "curso": sentence(3),
+            "instituicao": sentence(2),
+            "local_edu": "Campinas, SP",
+            "data_conclusao": f"12/{1995 + i}",
+            "detalhes_edu": sentence(15),
+        } for i in range(education)],
+        "habilidades": ", ".join(sentence(rng.randint(1, 3)) for _ in range(skills)),
+    })
+
+
+# ----- MEDIÇÃO -----
+def timeit(function, repeat):
+    """Executa function repeat vezes e retorna a mediana dos tempos, em segundos."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def peak_rss_mb():
+    """Pico de memória residente do processo, em MB (None se indisponível)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def bench_story(resume, repeat):
+    """Montagem da story sem cache e com o cache de seções já aquecido."""
+    styles = get_styles()
+    cold = timeit(lambda: build_story(resume, styles, cache=None), repeat)
+    flowable_cache.clear()
+    build_story(resume, styles)
+    warm = timeit(lambda: build_story(resume, styles), repeat)
+    return {"story": cold, "story_cached": warm}
+
+
+def bench_build(resume, repeat):
+    """doc.build isolado (a story é montada fora da medição) e a renderização completa."""
+    styles = get_styles()
+    times = []
+    size = 0
+    for _ in range(repeat):
+        story = build_story(resume, styles, cache=None)
+        buffer = io.BytesIO()
+        doc = make_doc_template(buffer)
+        start = time.perf_counter()
+        doc.build(story)
+        times.append(time.perf_counter() - start)
+        size = buffer.tell()
+
+    def full_render():
+        make_doc_template(io.BytesIO()).build(build_story(resume, styles, cache=None))
+
+    return {"build": statistics.median(times), "render": timeit(full_render, repeat)}, size
+
+
+def bench_snapshot(resume, repeat):
+    """
+    _get_data_from_ui com a interface preenchida com o currículo (requer display;
+    em servidores, use Xvfb). Retorna None quando não há display.
+    """
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception:
+        return None
+    try:
+        root.withdraw()
+        from curriculum import ResumeBuilderApp
+        app = ResumeBuilderApp(root)
+        for populate in list(app._pending_tabs.values()):
+            populate()
+        app._pending_tabs.clear()
+
+        for name in ("nome_completo", "email", "telefone", "linkedin"):
+            app.data[name].set(getattr(resume, name))
+        app.summary_text.insert("1.0", resume.resumo)
+        app.skills_text.insert("1.0", resume.habilidades)
+        fill = ((app.data["experiencias"], app._add_experience_entry, resume.experiencias, "descricao"),
+                (app.data["educacao"], app._add_education_entry, resume.educacao, "detalhes_edu"))
+        for entries, add_entry, items, text_field in fill:
+            while len(entries) < len(items):
+                add_entry()
+            for entry, item in zip(entries, items):
+                for name in type(item).__dataclass_fields__:
+                    if name == text_field:
+                        entry[name].insert("1.0", getattr(item, name))
+                    else:
+                        entry[name].set(getattr(item, name))
+        root.update_idletasks()
+        return timeit(app._get_data_from_ui, repeat)
+    finally:
+        root.destroy()
+
+
+def bench_startup(repeat):
+    """Inicialização a frio em processos novos: importação do motor e abertura da janela."""
+    results = {}
+    command = [sys.executable, "-c", "import engine; engine.get_styles()"]
+    results["startup_engine"] = timeit(lambda: subprocess.run(command, cwd=HERE, check=True), repeat)
+
+    gui_times = []
+    for _ in range(repeat):
+        completed = subprocess.run([sys.executable, os.path.join(HERE, "curriculum.py"), "--startup-time"],
+                                   cwd=HERE, capture_output=True, text=True)
+        if completed.returncode != 0:
+            break
+        gui_times.append(float(completed.stdout.split(":")[-1].split()[0]) / 1000)
+    if gui_times:
+        results["startup_gui"] = statistics.median(gui_times)
+    return results
+
+
+def run_benchmarks(resume, repeat=5, startup=True):
+    """
+    Executa todas as fases e retorna as medianas (segundos) e métricas auxiliares.
+
+    Returns:
+        dict: {"fases": {fase: segundos}, "throughput": currículos/s, "pdf_bytes": ..., "pico_rss_mb": ...}
+    """
+    phases = {}
+    snapshot = bench_snapshot(resume, repeat)
+    if snapshot is not None:
+        phases["snapshot"] = snapshot
+    phases.update(bench_story(resume, repeat))
+    build, pdf_bytes = bench_build(resume, repeat)
+    phases.update(build)
+    if startup:
+        phases.update(bench_startup(repeat))
+    return {
+        "fases": phases,
+        "throughput": 1 / phases["render"],
+        "pdf_bytes": pdf_bytes,
+        "pico_rss_mb": peak_rss_mb(),
+    }
+
+
+# ----- COMPARAÇÃO COM A LINHA DE BASE -----
+# Métricas comparadas além das fases: nome -> True se um valor maior for pior.
+METRICS = {"throughput": False, "pico_rss_mb": True}
+
+
+def compare(results, baseline, threshold=0.2, phase_thresholds=None):
+    """
+    Compara as fases, o throughput e o pico de memória com a linha de base.
+
+    Args:
+        results (dict): Resultado de run_benchmarks.
+        baseline (dict): Resultado gravado anteriormente.
+        threshold (float): Piora relativa tolerada (0.2 = 20% mais lento, 20% a mais
+            de memória ou throughput 20% menor em relação ao tempo de renderização).
+        phase_thresholds (dict, opcional): Limites específicos por fase ou métrica
+            (ex.: {"build": 0.3, "pico_rss_mb": 0.5}).
+
+    Returns:
+        list: Tuplas (nome, base, atual, variação, regressão?). As fases da linha de
+        base ausentes desta execução (ex.: snapshot sem display) têm atual e
+        variação None e não contam como regressão.
+    """
+    phase_thresholds = phase_thresholds or {}
+    base_phases = baseline.get("fases", {})
+    current_phases = results["fases"]
+    items = [(phase, base, current_phases.get(phase), True) for phase, base in base_phases.items()]
+    items += [(name, baseline.get(name), results.get(name), higher_is_worse)
+              for name, higher_is_worse in METRICS.items()]
+
+    rows = []
+    for name, base, current, higher_is_worse in items:
+        if not base:
+            continue
+        if current is None:
+            rows.append((name, base, None, None, False))
+            continue
+        change = current / base - 1
+        # Piora relativa: para o throughput, equivale ao aumento do tempo por currículo.
+        worse = change if higher_is_worse else base / current - 1 if current else float("inf")
+        rows.append((name, base, current, change, worse > phase_thresholds.get(name, threshold)))
+    return rows
+
+
+def phase_threshold(text):
+    """Converte "FASE=LIMITE" (ex.: "build=0.3") em (fase, limite); usado pelo argparse."""
+    name, sep, value = text.partition("=")
+    try:
+        if not sep or not name.strip():
+            raise ValueError
+        return name.strip(), float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"esperado FASE=LIMITE (ex.: build=0.3), recebido {text!r}") from None
+
+
+def format_value(name, value):
+    """Formata o valor de uma fase (ms) ou métrica para o relatório da comparação."""
+    if name == "throughput":
+        return f"{value:10.1f} currículos/s"
+    if name == "pico_rss_mb":
+        return f"{value:10.1f} MB"
+    return f"{value * 1000:10.2f} ms"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks do Construtor de Currículo.")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="medio", help="Tamanho do currículo sintético (padrão: %(default)s).")
+    parser.add_argument("--experiences", type=int, help="Número de experiências (substitui o perfil).")
+    parser.add_argument("--bullets", type=int, help="Bullet points por experiência (substitui o perfil).")
+    parser.add_argument("--skills", type=int, help="Número de habilidades (substitui o perfil).")
+    parser.add_argument("--education", type=int, help="Número de formações (substitui o perfil).")
+    parser.add_argument("--unicode", action="store_true", help="Usa texto com muitos acentos e alfabetos não latinos.")
+    parser.add_argument("--repeat", type=int, default=5, help="Repetições por fase; reporta a mediana (padrão: %(default)s).")
+    parser.add_argument("--no-startup", action="store_true", help="Não mede a inicialização a frio.")
+    parser.add_argument("--json", help="Grava os resultados neste arquivo JSON.")
+    parser.add_argument("--baseline", help="Linha de base (JSON) para comparação.")
+    parser.add_argument("--save-baseline", help="Grava os resultados como nova linha de base.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Piora relativa tolerada por fase, no throughput e no pico de memória (padrão: %(default)s).")
+    parser.add_argument("--phase-threshold", type=phase_threshold, action="append", default=[], metavar="FASE=LIMITE",
+                        help="Limite específico de uma fase ou métrica (ex.: build=0.3, pico_rss_mb=0.5); pode ser repetido.")
+    args = parser.parse_args(argv)
+
+    experiences, bullets, skills, education = PROFILES[args.profile]
+    resume = synthetic_resume(
+        experiences=experiences if args.experiences is None else args.experiences,
+        bullets=bullets if args.bullets is None else args.bullets,
+        skills=skills if args.skills is None else args.skills,
+        education=education if args.education is None else args.education,
+        unicode=args.unicode,
+    )
+    results = run_benchmarks(resume, args.repeat, startup=not args.no_startup)
+    results["parametros"] = {"perfil": args.profile, "experiencias": len(resume.experiencias),
+                             "formacoes": len(resume.educacao), "unicode": args.unicode, "repeticoes": args.repeat}
+
+    for phase, seconds in results["fases"].items():
+        print(f"{phase:<16} {seconds * 1000:10.2f} ms")
+    print(f"{'throughput':<16} {results['throughput']:10.1f} currículos/s")
+    print(f"{'pdf':<16} {results['pdf_bytes'] / 1024:10.1f} KB")
+    if results["pico_rss_mb"] is not None:
+        print(f"{'pico RSS':<16} {results['pico_rss_mb']:10.1f} MB")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = 0
+        print("\nComparação com a linha de base:")
+        for name, base, current, change, regressed in compare(results, baseline, args.threshold,
+                                                              dict(args.phase_threshold)):
+            if current is None:
+                print(f"{name:<16} {format_value(name, base)}  não medida nesta execução")
+                continue
+            regressions += regressed
+            mark = "REGRESSÃO" if regressed else "ok"
+            print(f"{name:<16} {format_value(name, base)} -> {format_value(name, current).strip()}  ({change:+.1%})  {mark}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
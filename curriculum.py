@@ -1,15 +1,186 @@
 # ----- IMPORTAÇÕES -----
+import time
+_STARTUP_T0 = time.perf_counter()
+
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+from models import Resume, Experience, Education
 import os
+import sys
+import argparse
+import threading
+
+# ----- LISTA VIRTUALIZADA DE ENTRADAS -----
+# Campos de linha única (nome, rótulo, largura) e campo de texto (nome, rótulo, altura)
+# das entradas de experiência e educação.
+EXPERIENCE_FIELDS = (("cargo", "Cargo:", 40),
+                     ("empresa", "Empresa:", 40),
+                     ("local", "Local (Cidade, Estado):", 40),
+                     ("data_inicio", "Data Início (Mês/Ano):", 15),
+                     ("data_fim", "Data Fim (Mês/Ano ou 'Atual'):", 15))
+EXPERIENCE_TEXT_FIELD = ("descricao", "Descrição (use '-' para bullet points):", 6)
+
+EDUCATION_FIELDS = (("curso", "Curso/Grau:", 40),
+                    ("instituicao", "Instituição:", 40),
+                    ("local_edu", "Local (Cidade, Estado):", 40),
+                    ("data_conclusao", "Data de Conclusão (Mês/Ano):", 15))
+EDUCATION_TEXT_FIELD = ("detalhes_edu", "Detalhes (Honras, GPA, etc. Opcional):", 3)
+
+
+class VirtualEntryList:
+    """
+    Lista de entradas (experiências ou formações) com widgets reciclados.
+
+    Os dados de todas as entradas ficam em self.items como strings; apenas um
+    pequeno conjunto fixo de editores é criado, e eles são religados às linhas
+    visíveis conforme o usuário rola a lista. Assim, currículos com centenas de
+    entradas abrem e rolam tão rápido quanto currículos com uma só.
+    """
+
+    def __init__(self, parent, title, fields, text_field, visible_rows=3):
+        """
+        Cria a lista virtualizada.
+
+        Args:
+            parent (tk.Widget): Widget onde a lista será exibida.
+            title (str): Título das entradas (ex.: "Experiência").
+            fields (tuple): Campos de linha única (nome, rótulo, largura).
+            text_field (tuple): Campo de texto multilinha (nome, rótulo, altura).
+            visible_rows (int): Número de editores criados e exibidos ao mesmo tempo.
+        """
+        self.title = title
+        self.fields = fields
+        self.text_field = text_field
+        self.items = []
+        self.first = 0
+
+        frame = ttk.Frame(parent)
+        frame.pack(fill=tk.BOTH, expand=True)
+        self.rows_frame = ttk.Frame(frame)
+        self.rows_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.editors = [self._create_editor() for _ in range(visible_rows)]
+        self._bind_mousewheel(self.rows_frame)
+        self._load()
+
+    def _create_editor(self):
+        """Cria um editor reutilizável (Labelframe com os campos de uma entrada)."""
+        entry_frame = ttk.Labelframe(self.rows_frame, padding="10")
+        editor = {"frame": entry_frame, "vars": {}, "index": None}
+
+        for row, (name, label, width) in enumerate(self.fields):
+            ttk.Label(entry_frame, text=label).grid(row=row, column=0, sticky=tk.W, padx=2, pady=2)
+            editor["vars"][name] = tk.StringVar()
+            ttk.Entry(entry_frame, textvariable=editor["vars"][name], width=width).grid(row=row, column=1, sticky=tk.EW if width > 15 else tk.W, padx=2, pady=2)
+
+        name, label, height = self.text_field
+        row = len(self.fields)
+        ttk.Label(entry_frame, text=label).grid(row=row, column=0, sticky=tk.NW, padx=2, pady=2)
+        editor["text"] = tk.Text(entry_frame, height=height, width=50, wrap=tk.WORD, font=('Arial', 10))
+        editor["text"].grid(row=row, column=1, sticky=tk.EW, padx=2, pady=2)
+
+        delete_button = ttk.Button(entry_frame, text="Excluir", command=lambda: self.remove(editor["index"]))
+        delete_button.grid(row=row + 1, column=1, sticky=tk.E, padx=2, pady=5)
+
+        entry_frame.columnconfigure(1, weight=1)
+        return editor
+
+    def _bind_mousewheel(self, widget):
+        """Liga a roda do mouse à rolagem da lista (exceto em caixas de texto)."""
+        if isinstance(widget, tk.Text):
+            return
+        widget.bind("<MouseWheel>", lambda e: self._scroll_by(-1 if e.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda e: self._scroll_by(-1))
+        widget.bind("<Button-5>", lambda e: self._scroll_by(1))
+        for child in widget.winfo_children():
+            self._bind_mousewheel(child)
+
+    # ----- SINCRONIZAÇÃO ENTRE DADOS E EDITORES -----
+    def _flush(self):
+        """Copia os valores dos editores visíveis para self.items."""
+        for editor in self.editors:
+            if editor["index"] is not None:
+                item = {name: var.get() for name, var in editor["vars"].items()}
+                item[self.text_field[0]] = editor["text"].get("1.0", tk.END).strip()
+                self.items[editor["index"]] = item
+
+    def _load(self):
+        """Liga cada editor à linha visível correspondente e atualiza a barra de rolagem."""
+        for offset, editor in enumerate(self.editors):
+            index = self.first + offset
+            if index < len(self.items):
+                item = self.items[index]
+                editor["index"] = index
+                editor["frame"].config(text=f"{self.title} #{index + 1}")
+                for name, var in editor["vars"].items():
+                    var.set(item.get(name, ""))
+                editor["text"].delete("1.0", tk.END)
+                editor["text"].insert("1.0", item.get(self.text_field[0], ""))
+                editor["frame"].pack(fill=tk.X, padx=5, pady=5)
+            else:
+                editor["index"] = None
+                editor["frame"].pack_forget()
+
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.first / total, min(self.first + len(self.editors), total) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # ----- ROLAGEM -----
+    def scroll_to(self, first):
+        """Exibe as entradas a partir do índice first."""
+        first = max(0, min(first, len(self.items) - len(self.editors)))
+        if first != self.first:
+            self._flush()
+            self.first = first
+            self._load()
+
+    def _scroll_by(self, rows):
+        self.scroll_to(self.first + rows)
+        return "break"
+
+    def _on_scrollbar(self, action, value, unit=None):
+        """Trata os comandos da barra de rolagem ("moveto" ou "scroll")."""
+        if action == "moveto":
+            self.scroll_to(round(float(value) * len(self.items)))
+        elif unit == "pages":
+            self.scroll_to(self.first + int(value) * len(self.editors))
+        else:
+            self.scroll_to(self.first + int(value))
+
+    # ----- OPERAÇÕES DA LISTA -----
+    def add(self, item=None):
+        """Adiciona uma entrada (vazia, por padrão) ao final e rola até ela."""
+        self._flush()
+        self.items.append(dict(item or {}))
+        self.first = max(0, len(self.items) - len(self.editors))
+        self._load()
+
+    def remove(self, index):
+        """Remove a entrada de índice index."""
+        if index is None:
+            return
+        self._flush()
+        del self.items[index]
+        self.first = max(0, min(self.first, len(self.items) - len(self.editors)))
+        self._load()
+
+    def values(self):
+        """Retorna os dados de todas as entradas (lendo apenas os editores visíveis)."""
+        self._flush()
+        return list(self.items)
+
 
 # ----- CLASSE PRINCIPAL DA APLICAÇÃO -----
+# Espera após a última edição antes de atualizar a pré-visualização (ms)
+PREVIEW_DELAY_MS = 500
+# Número de páginas a partir do qual a pré-visualização exibe um aviso
+PREVIEW_MAX_PAGES = 2
+
+
 class ResumeBuilderApp:
     """
     Uma aplicação GUI para construir currículos otimizados para ATS.
@@ -17,79 +188,83 @@ class ResumeBuilderApp:
     educação e habilidades, e então gerar um arquivo PDF.
     """
 
-    def __init__(self, master):
+    def __init__(self, master, virtualized=False, instrumentation=None):
         """
         Inicializa a aplicação ResumeBuilderApp.
 
         Args:
             master (tk.Tk): A janela raiz do Tkinter.
+            virtualized (bool): Usa listas virtualizadas (VirtualEntryList) para
+                experiências e formações, indicado para currículos muito longos.
+            instrumentation (Instrumentation, opcional): Recebe o registro de cada geração
+                de PDF; padrão: registros de erro em JSON na saída de erro.
         """
         self.master = master
+        self.virtualized = virtualized
         master.title("Construtor de Currículo ATS-Friendly")
         master.geometry("800x700") 
 
-        # Estilos para ReportLab
-        self.styles = getSampleStyleSheet()
-        self.setup_custom_styles()
+        # Estilos para ReportLab: o ReportLab só é carregado na primeira geração
+        # (ou no pré-carregamento em segundo plano, após a janela aparecer)
+        self.styles = None
+        self._styles_lock = threading.Lock()
 
-        # Variáveis para armazenar os dados do currículo
+        # Variáveis e widgets de entrada dos dados do currículo
         self.data = {
             "nome_completo": tk.StringVar(),
             "email": tk.StringVar(),
             "telefone": tk.StringVar(),
             "linkedin": tk.StringVar(), 
-            "resumo": tk.StringVar(),
             "experiencias": [], 
-            "educacao": [],   
-            "habilidades": tk.StringVar() 
+            "educacao": []
         }
 
+        # Gerações de PDF em andamento (um threading.Event de cancelamento por geração)
+        self.instrumentation = instrumentation
+        self._render_jobs = set()
+        self._current_render_job = None
+
+        # Pré-visualização: agendamento (after), thread em andamento e último instantâneo exibido
+        self._preview_after_id = None
+        self._preview_running = False
+        self._preview_pending = False
+        self._preview_resume = None
+
         # Configuração da interface gráfica
         self._create_widgets()
 
     def setup_custom_styles(self):
-        """Configura estilos personalizados para o PDF."""
-        self.styles.add(ParagraphStyle(name='NomeCandidato',
-                                        fontName='Helvetica-Bold',
-                                        fontSize=18,
-                                        leading=22,
-                                        alignment=TA_CENTER,
-                                        spaceAfter=6))
-        self.styles.add(ParagraphStyle(name='ContatoInfo',
-                                        fontName='Helvetica',
-                                        fontSize=10,
-                                        leading=12,
-                                        alignment=TA_CENTER,
-                                        spaceAfter=12))
-        self.styles.add(ParagraphStyle(name='SecaoTitulo',
-                                        fontName='Helvetica-Bold',
-                                        fontSize=14,
-                                        leading=18,
-                                        spaceBefore=12,
-                                        spaceAfter=6))
-        self.styles.add(ParagraphStyle(name='SubTitulo',
-                                        fontName='Helvetica-Bold',
-                                        fontSize=11,
-                                        leading=14,
-                                        spaceAfter=2))
-        self.styles.add(ParagraphStyle(name='Detalhes', 
-                                        fontName='Helvetica-Oblique',
-                                        fontSize=10,
-                                        leading=12,
-                                        spaceAfter=2))
-        self.styles.add(ParagraphStyle(name='CorpoTexto',
-                                        fontName='Helvetica',
-                                        fontSize=10,
-                                        leading=12,
-                                        bulletIndent=18, 
-                                        leftIndent=18, 
-                                        spaceAfter=6))
-        self.styles.add(ParagraphStyle(name='BulletPoints',
-                                    parent=self.styles['CorpoTexto'],
-                                    bulletIndent=20,
-                                    leftIndent=20,
-                                    spaceBefore=0,
-                                    spaceAfter=2))
+        """
+        Configura estilos personalizados para o PDF, carregando o ReportLab na primeira chamada.
+
+        Returns:
+            Mapping: Os estilos do currículo, compartilhados por todo o processo.
+        """
+        with self._styles_lock:
+            if self.styles is None:
+                from engine import get_styles
+                self.styles = get_styles()
+        return self.styles
+
+    def warm_up(self):
+        """Carrega o ReportLab e os estilos em segundo plano, sem atrasar a abertura da janela."""
+        threading.Thread(target=self.setup_custom_styles, daemon=True).start()
+
+    def on_window_shown(self, report_startup=False):
+        """
+        Registra o tempo de inicialização e inicia o pré-carregamento do ReportLab.
+
+        Args:
+            report_startup (bool): Imprime o tempo de inicialização e fecha a janela
+                (usado para acompanhar regressões de desempenho na abertura).
+        """
+        self.master.update_idletasks()
+        self.startup_seconds = time.perf_counter() - _STARTUP_T0
+        if report_startup:
+            print(f"Tempo de inicialização: {self.startup_seconds * 1000:.1f} ms")
+            self.master.destroy()
+            return
+        self.master.after(100, self.warm_up)
 
     # ----- CRIAÇÃO DE WIDGETS DA UI -----
     def _create_widgets(self):
@@ -99,6 +274,7 @@ class ResumeBuilderApp:
 
         # Notebook para seções
         notebook = ttk.Notebook(main_frame)
+        self.notebook = notebook
         notebook.pack(expand=True, fill=tk.BOTH, pady=10)
 
         # Abas
@@ -107,22 +283,65 @@ class ResumeBuilderApp:
         self.experience_container, self.experience_frame = self._create_scrollable_frame(notebook, "Experiência")
         self.education_container, self.education_frame = self._create_scrollable_frame(notebook, "Educação")
         self.skills_container, self.skills_frame = self._create_scrollable_frame(notebook, "Habilidades")
+        self.preview_container = ttk.Frame(notebook, padding="10")
 
         notebook.add(self.personal_info_container, text="Informações Pessoais")
         notebook.add(self.summary_container, text="Resumo")
         notebook.add(self.experience_container, text="Experiência")
         notebook.add(self.education_container, text="Educação")
         notebook.add(self.skills_container, text="Habilidades")
-
+        notebook.add(self.preview_container, text="Pré-visualização")
+
+        # Apenas a aba visível é populada agora; as demais, quando selecionadas pela primeira vez
+        self.summary_text = None
+        self.skills_text = None
+        self.experience_list = None
+        self.education_list = None
+        self.preview_text = None
+        self._pending_tabs = {
+            str(self.summary_container): self._populate_summary_frame,
+            str(self.experience_container): self._populate_experience_frame,
+            str(self.education_container): self._populate_education_frame,
+            str(self.skills_container): self._populate_skills_frame,
+            str(self.preview_container): self._populate_preview_frame,
+        }
         self._populate_personal_info_frame()
-        self._populate_summary_frame()
-        self._populate_experience_frame() 
-        self._populate_education_frame()  
-        self._populate_skills_frame()
-
-        # Botão Gerar PDF
-        generate_button = ttk.Button(main_frame, text="Gerar PDF", command=self._generate_pdf)
-        generate_button.pack(pady=20)
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Botões Gerar PDF / Cancelar e progresso da geração
+        actions_frame = ttk.Frame(main_frame)
+        actions_frame.pack(fill=tk.X, pady=20)
+        generate_button = ttk.Button(actions_frame, text="Gerar PDF", command=self._generate_pdf)
+        generate_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(actions_frame, text="Cancelar", command=self._cancel_renders, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        self.progress_bar = ttk.Progressbar(actions_frame, mode="determinate", maximum=100)
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        self.status_label = ttk.Label(actions_frame, text="", width=30)
+        self.status_label.pack(side=tk.LEFT, padx=5)
+
+        # Ajuste automático a N páginas (0 = desativado)
+        self.fit_pages = tk.IntVar(value=0)
+        ttk.Label(actions_frame, text="Ajustar a (páginas, 0 = não):").pack(side=tk.LEFT, padx=(10, 2))
+        ttk.Spinbox(actions_frame, from_=0, to=5, width=3, textvariable=self.fit_pages).pack(side=tk.LEFT)
+
+        # Formatos gerados junto com o PDF, a partir dos mesmos dados
+        formats_frame = ttk.Frame(main_frame)
+        formats_frame.pack(fill=tk.X)
+        ttk.Label(formats_frame, text="Exportar também:").pack(side=tk.LEFT, padx=5)
+        self.export_formats = {}
+        for name, label in (("txt", "Texto (.txt)"), ("docx", "Word (.docx)"), ("json", "JSON Resume (.json)")):
+            self.export_formats[name] = tk.BooleanVar(value=False)
+            ttk.Checkbutton(formats_frame, text=label, variable=self.export_formats[name]).pack(side=tk.LEFT, padx=5)
+
+    def _on_tab_changed(self, event):
+        """Popula a aba selecionada na primeira vez em que ela é exibida."""
+        selected = self.notebook.select()
+        populate = self._pending_tabs.pop(selected, None)
+        if populate is not None:
+            populate()
+        if selected == str(self.preview_container):
+            self._schedule_preview()
 
     def _create_scrollable_frame(self, parent, title):
         """Cria um frame com scrollbar dentro de um container (como um Notebook)."""
@@ -134,12 +353,19 @@ class ResumeBuilderApp:
         scrollbar = ttk.Scrollbar(container, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
+        # Recalcula a área de rolagem uma única vez por ciclo ocioso, e não a cada
+        # <Configure> gerado enquanto os widgets filhos são criados ou redimensionados.
+        pending = []
+
+        def update_scrollregion():
+            pending.clear()
+            canvas.configure(scrollregion=(0, 0, scrollable_frame.winfo_reqwidth(), scrollable_frame.winfo_reqheight()))
+
+        def on_configure(event):
+            if not pending:
+                pending.append(canvas.after_idle(update_scrollregion))
+
+        scrollable_frame.bind("<Configure>", on_configure)
 
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -178,6 +404,12 @@ class ResumeBuilderApp:
     # ----- SEÇÃO: EXPERIÊNCIA PROFISSIONAL -----
     def _populate_experience_frame(self):
         """Popula o frame de experiência profissional."""
+        if self.virtualized:
+            self.experience_list = VirtualEntryList(self.experience_frame, "Experiência", EXPERIENCE_FIELDS, EXPERIENCE_TEXT_FIELD)
+            self.experience_list.add()
+            ttk.Button(self.experience_frame, text="Adicionar Outra Experiência", command=self.experience_list.add).pack(pady=10)
+            return
+
         self.experience_entries_frame = ttk.Frame(self.experience_frame)
         self.experience_entries_frame.pack(fill=tk.X)
         self._add_experience_entry() 
@@ -234,6 +466,12 @@ class ResumeBuilderApp:
     # ----- SEÇÃO: EDUCAÇÃO -----
     def _populate_education_frame(self):
         """Popula o frame de educação."""
+        if self.virtualized:
+            self.education_list = VirtualEntryList(self.education_frame, "Formação", EDUCATION_FIELDS, EDUCATION_TEXT_FIELD)
+            self.education_list.add()
+            ttk.Button(self.education_frame, text="Adicionar Outra Formação", command=self.education_list.add).pack(pady=10)
+            return
+
         self.education_entries_frame = ttk.Frame(self.education_container)
         self.education_entries_frame.pack(fill=tk.X)
         self._add_education_entry() 
@@ -291,27 +529,137 @@ class ResumeBuilderApp:
         self.skills_text = tk.Text(frame, height=5, width=70, wrap=tk.WORD, font=('Arial', 10))
         self.skills_text.pack(padx=5, pady=5, fill=tk.BOTH, expand=True)
 
+    # ----- SEÇÃO: PRÉ-VISUALIZAÇÃO -----
+    def _populate_preview_frame(self):
+        """Popula a aba de pré-visualização e passa a atualizá-la a cada edição."""
+        frame = self.preview_container
+        self.preview_info_label = ttk.Label(frame, text="Gerando pré-visualização...", font=('Arial', 11))
+        self.preview_info_label.pack(padx=5, pady=5, anchor=tk.W)
+        self.preview_warning_label = ttk.Label(frame, text="", foreground="red")
+        self.preview_warning_label.pack(padx=5, anchor=tk.W)
+
+        text_frame = ttk.Frame(frame)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical")
+        self.preview_text = tk.Text(text_frame, wrap=tk.WORD, font=('Arial', 10), state=tk.DISABLED, yscrollcommand=scrollbar.set)
+        scrollbar.config(command=self.preview_text.yview)
+        self.preview_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Qualquer tecla ou clique (inclusive adicionar/excluir entradas) agenda uma atualização
+        self.master.bind_all("<KeyRelease>", self._schedule_preview, add="+")
+        self.master.bind_all("<ButtonRelease-1>", self._schedule_preview, add="+")
+
+    def _schedule_preview(self, event=None):
+        """Agenda a pré-visualização para PREVIEW_DELAY_MS após a última edição (debounce)."""
+        if self.preview_text is None:
+            return
+        if self._preview_after_id is not None:
+            self.master.after_cancel(self._preview_after_id)
+        self._preview_after_id = self.master.after(PREVIEW_DELAY_MS, self._start_preview)
+
+    def _start_preview(self):
+        """Gera a pré-visualização em segundo plano, se os dados mudaram desde a última."""
+        self._preview_after_id = None
+        if self._preview_running:
+            # Uma pré-visualização já está em andamento: ao terminar, ela gera a mais recente
+            self._preview_pending = True
+            return
+        resume = self._get_data_from_ui()
+        if resume == self._preview_resume:
+            return
+        self._preview_running = True
+        threading.Thread(target=self._preview_worker, args=(resume,), daemon=True).start()
+
+    def _preview_worker(self, resume):
+        """Gera o PDF em memória (executado fora do thread da interface)."""
+        from engine import render_preview
+        try:
+            preview = render_preview(resume, self.setup_custom_styles())
+        except Exception as e:
+            self._post_to_ui(self._on_preview_done, resume, None, e)
+        else:
+            self._post_to_ui(self._on_preview_done, resume, preview, None)
+
+    def _on_preview_done(self, resume, preview, error):
+        """Exibe o resultado da pré-visualização e inicia a próxima, se houver edições pendentes."""
+        self._preview_running = False
+        if error is not None:
+            self.preview_info_label.config(text=f"Erro na pré-visualização: {error}")
+            self.preview_warning_label.config(text="")
+        else:
+            self._preview_resume = resume
+            self.preview_info_label.config(text=f"Páginas: {preview.page_count}  |  Tamanho: {len(preview.pdf) / 1024:.1f} KB")
+            if preview.page_count > PREVIEW_MAX_PAGES:
+                self.preview_warning_label.config(text=f"Atenção: o currículo ultrapassa {PREVIEW_MAX_PAGES} páginas.")
+            else:
+                self.preview_warning_label.config(text="")
+
+            self.preview_text.config(state=tk.NORMAL)
+            self.preview_text.delete("1.0", tk.END)
+            for number, lines in enumerate(preview.pages, start=1):
+                self.preview_text.insert(tk.END, f"--- Página {number} ---\n" + "\n".join(lines) + "\n\n")
+            self.preview_text.config(state=tk.DISABLED)
+
+        if self._preview_pending:
+            self._preview_pending = False
+            self._start_preview()
+
     # ----- LÓGICA DE GERAÇÃO DO PDF -----
     def _get_data_from_ui(self):
-        """Coleta os dados dos widgets da UI e armazena em self.data."""
-
-        # Resumo
-        self.data["resumo"] = self.summary_text.get("1.0", tk.END).strip()
-
-        for i, exp_entry_ui in enumerate(self.data["experiencias"]):
-            exp_entry_ui["descricao_text"] = exp_entry_ui["descricao"].get("1.0", tk.END).strip()
-
+        """
+        Coleta os dados dos widgets da UI em um único passo.
 
-        # Educação 
-        for i, edu_entry_ui in enumerate(self.data["educacao"]):
-            edu_entry_ui["detalhes_edu_text"] = edu_entry_ui["detalhes_edu"].get("1.0", tk.END).strip()
+        Cada campo é lido uma única vez e nada é gravado de volta em self.data.
+        Abas ainda não exibidas (e, portanto, não populadas) contribuem com dados vazios.
 
-        # Habilidades
-        self.data["habilidades"] = self.skills_text.get("1.0", tk.END).strip()
+        Returns:
+            Resume: Instantâneo imutável dos dados, independente dos widgets.
+        """
+        if self.virtualized:
+            experiencias = tuple(Experience(**item) for item in self.experience_list.values()) if self.experience_list else ()
+            educacao = tuple(Education(**item) for item in self.education_list.values()) if self.education_list else ()
+        else:
+            experiencias = tuple(Experience(cargo=exp["cargo"].get(),
+                                            empresa=exp["empresa"].get(),
+                                            local=exp["local"].get(),
+                                            data_inicio=exp["data_inicio"].get(),
+                                            data_fim=exp["data_fim"].get(),
+                                            descricao=exp["descricao"].get("1.0", tk.END).strip())
+                                 for exp in self.data["experiencias"])
+            educacao = tuple(Education(curso=edu["curso"].get(),
+                                       instituicao=edu["instituicao"].get(),
+                                       local_edu=edu["local_edu"].get(),
+                                       data_conclusao=edu["data_conclusao"].get(),
+                                       detalhes_edu=edu["detalhes_edu"].get("1.0", tk.END).strip())
+                             for edu in self.data["educacao"])
+
+        return Resume(
+            nome_completo=self.data["nome_completo"].get(),
+            email=self.data["email"].get(),
+            telefone=self.data["telefone"].get(),
+            linkedin=self.data["linkedin"].get(),
+            resumo=self.summary_text.get("1.0", tk.END).strip() if self.summary_text else "",
+            experiencias=experiencias,
+            educacao=educacao,
+            habilidades=self.skills_text.get("1.0", tk.END).strip() if self.skills_text else "",
+        )
 
     def _generate_pdf(self):
-        """Gera o currículo em formato PDF."""
-        self._get_data_from_ui() 
+        """
+        Gera o currículo em formato PDF em segundo plano.
+
+        Os dados são copiados dos widgets no thread principal; a montagem do PDF e a
+        gravação do arquivo ocorrem em um thread separado, sem congelar a janela.
+        """
+        start = time.perf_counter()
+        resume = self._get_data_from_ui()
+        snapshot_seconds = time.perf_counter() - start
+        try:
+            fit_pages = max(self.fit_pages.get(), 0)
+        except tk.TclError:
+            fit_pages = 0
+        formats = ["pdf", *(name for name, var in self.export_formats.items() if var.get())]
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".pdf",
@@ -319,106 +667,180 @@ class ResumeBuilderApp:
             title="Salvar Currículo Como..."
         )
         if not file_path:
-            return 
-
+            return
+
+        if self.instrumentation is None:
+            from instrumentation import Instrumentation, JsonLinesWriter, only_errors
+            self.instrumentation = Instrumentation([only_errors(JsonLinesWriter(sys.stderr))])
+
+        cancel = threading.Event()
+        self._render_jobs.add(cancel)
+        self._current_render_job = cancel
+        self.progress_bar["value"] = 0
+        self.status_label.config(text="Gerando PDF...")
+        self.cancel_button.config(state=tk.NORMAL)
+        threading.Thread(target=self._render_worker, args=(resume, file_path, cancel, fit_pages, snapshot_seconds, formats),
+                         daemon=True).start()
+
+    def _cancel_renders(self):
+        """Cancela todas as gerações de PDF em andamento."""
+        for cancel in self._render_jobs:
+            cancel.set()
+        self.status_label.config(text="Cancelando...")
+
+    def _post_to_ui(self, callback, *args):
+        """Agenda uma chamada no thread da interface (ignorada se a janela já foi fechada)."""
         try:
-            doc = SimpleDocTemplate(file_path, pagesize=letter,
-                                    rightMargin=0.75*inch, leftMargin=0.75*inch,
-                                    topMargin=0.75*inch, bottomMargin=0.75*inch)
-            story = []
-
-            # --- Nome e Contato ---
-            if self.data["nome_completo"].get():
-                story.append(Paragraph(self.data["nome_completo"].get().upper(), self.styles['NomeCandidato']))
-            
-            contact_info = []
-            if self.data["email"].get(): contact_info.append(self.data["email"].get())
-            if self.data["telefone"].get(): contact_info.append(self.data["telefone"].get())
-            if self.data["linkedin"].get(): contact_info.append(self.data["linkedin"].get())
-            if contact_info:
-                story.append(Paragraph(" | ".join(contact_info), self.styles['ContatoInfo']))
-            story.append(Spacer(1, 0.1*inch))
-
-            # --- Resumo ---
-            if self.data["resumo"]:
-                story.append(Paragraph("RESUMO PROFISSIONAL", self.styles['SecaoTitulo']))
-                story.append(HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=1, spaceAfter=1, hAlign='LEFT', vAlign='BOTTOM', lineCap='round'))
-                story.append(Paragraph(self.data["resumo"], self.styles['CorpoTexto']))
-                story.append(Spacer(1, 0.1*inch))
-
-            # --- Experiência ---
-            if any(exp["cargo"].get() or exp["empresa"].get() for exp in self.data["experiencias"]):
-                story.append(Paragraph("EXPERIÊNCIA PROFISSIONAL", self.styles['SecaoTitulo']))
-                story.append(HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=1, spaceAfter=1))
-                for exp in self.data["experiencias"]:
-                    if not (exp["cargo"].get() or exp["empresa"].get()): continue 
-
-                    story.append(Paragraph(exp["cargo"].get().upper(), self.styles['SubTitulo']))
-                    
-                    empresa_local_data = []
-                    if exp["empresa"].get(): empresa_local_data.append(exp["empresa"].get())
-                    if exp["local"].get(): empresa_local_data.append(exp["local"].get())
-                    if exp["data_inicio"].get() or exp["data_fim"].get():
-                        datas = f"{exp['data_inicio'].get()} - {exp['data_fim'].get()}"
-                        empresa_local_data.append(datas)
-                    
-                    if empresa_local_data:
-                        story.append(Paragraph(" | ".join(empresa_local_data), self.styles['Detalhes']))
-
-                    # Descrição com bullet points
-                    desc_text = exp["descricao_text"]
-                    if desc_text:
-                        responsibilities = desc_text.split('\n')
-                        for resp in responsibilities:
-                            resp = resp.strip()
-                            if resp.startswith("-"):
-                                resp = resp[1:].strip()
-                                story.append(Paragraph(resp, self.styles['BulletPoints'], bulletText='•'))
-                            elif resp: 
-                                story.append(Paragraph(resp, self.styles['CorpoTexto']))
-                    story.append(Spacer(1, 0.1*inch))
-
-            # --- Educação ---
-            if any(edu["curso"].get() or edu["instituicao"].get() for edu in self.data["educacao"]):
-                story.append(Paragraph("FORMAÇÃO ACADÊMICA", self.styles['SecaoTitulo']))
-                story.append(HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=1, spaceAfter=1))
-                for edu in self.data["educacao"]:
-                    if not (edu["curso"].get() or edu["instituicao"].get()): continue
-
-                    story.append(Paragraph(edu["curso"].get().upper(), self.styles['SubTitulo']))
-                    
-                    instituicao_local_data = []
-                    if edu["instituicao"].get(): instituicao_local_data.append(edu["instituicao"].get())
-                    if edu["local_edu"].get(): instituicao_local_data.append(edu["local_edu"].get())
-                    if edu["data_conclusao"].get(): instituicao_local_data.append(edu["data_conclusao"].get())
-                    
-                    if instituicao_local_data:
-                        story.append(Paragraph(" | ".join(instituicao_local_data), self.styles['Detalhes']))
-                    
-                    detalhes_edu_text = edu["detalhes_edu_text"]
-                    if detalhes_edu_text:
-                        story.append(Paragraph(detalhes_edu_text, self.styles['CorpoTexto']))
-                    story.append(Spacer(1, 0.1*inch))
-
-            # --- Habilidades ---
-            if self.data["habilidades"]:
-                story.append(Paragraph("HABILIDADES", self.styles['SecaoTitulo']))
-                story.append(HRFlowable(width="100%", thickness=0.5, color=colors.grey, spaceBefore=1, spaceAfter=1))
-                habilidades_list = [s.strip() for s in self.data["habilidades"].replace(',', '\n').split('\n') if s.strip()]
-                if habilidades_list:
-                    for habilidade in habilidades_list:
-                         story.append(Paragraph(habilidade, self.styles['BulletPoints'], bulletText='•'))
-                story.append(Spacer(1, 0.1*inch))
-
-            doc.build(story)
-            messagebox.showinfo("Sucesso", f"Currículo salvo em:\n{file_path}")
+            self.master.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
 
+    def _render_worker(self, resume, file_path, cancel, fit_pages=0, snapshot_seconds=0.0, formats=("pdf",)):
+        """
+        Monta o PDF e grava o arquivo (executado fora do thread da interface).
+
+        Com fit_pages > 0, os estilos são reduzidos até o currículo caber nesse número de páginas.
+        O PDF é gravado exatamente em file_path (o caminho confirmado no diálogo); os
+        demais formatos em formats são gerados em paralelo, com o mesmo nome de arquivo
+        sem a extensão .pdf e a extensão de cada formato.
+        Cada fase (leitura dos widgets, ajuste, story, layout e gravação) é medida por
+        self.instrumentation.
+        """
+        last_percent = [-1]
+
+        def progress(fraction):
+            percent = int(fraction * 100)
+            if percent != last_percent[0]:
+                last_percent[0] = percent
+                self._post_to_ui(self._on_render_progress, cancel, percent)
+
+        from engine import RenderCancelled
+        from export import export_bytes, save
+        from fileio import atomic_write
+        error, cancelled, paths, warning = None, False, [file_path], None
+        try:
+            with self.instrumentation.trace(origem="interface", arquivo=file_path) as trace:
+                trace.add_phase("snapshot", snapshot_seconds)
+                try:
+                    if fit_pages:
+                        from autofit import fit_to_pages
+                        with trace.phase("autofit"):
+                            fit = fit_to_pages(resume, fit_pages)
+                        styles = fit.styles
+                        if not fit.fits:
+                            warning = (f"O currículo não coube em {fit_pages} página(s) nem com a menor escala "
+                                       f"({fit.scale:.0%}); o PDF tem {fit.pages} páginas.")
+                    else:
+                        styles = self.setup_custom_styles()
+                    pdf_options = {"styles": styles, "progress": progress, "cancel": cancel, "trace": trace}
+                    contents = export_bytes(resume, formats, {"pdf": pdf_options})
+                    if cancel.is_set():
+                        raise RenderCancelled()
+                    # Cada arquivo é gravado com um nome temporário e renomeado, para não deixar arquivos incompletos
+                    with trace.phase("write"):
+                        atomic_write(file_path, contents.pop("pdf"))
+                        stem, extension = os.path.splitext(file_path)
+                        base_path = stem if extension.lower() == ".pdf" else file_path
+                        paths = [file_path, *save(contents, base_path).values()]
+                except RenderCancelled:
+                    cancelled = True
+                    trace.set(cancelado=True)
         except Exception as e:
-            messagebox.showerror("Erro ao Gerar PDF", f"Ocorreu um erro: {e}\nVerifique os dados e tente novamente.")
-            print(f"Erro detalhado: {e}") 
+            error = e
+        self._post_to_ui(self._on_render_done, cancel, paths, error, cancelled, warning)
+
+    def _on_render_progress(self, cancel, percent):
+        """Atualiza a barra de progresso com o andamento da geração mais recente."""
+        if cancel is self._current_render_job and not cancel.is_set():
+            self.progress_bar["value"] = percent
+            self.status_label.config(text=f"Gerando PDF... {percent}%")
+
+    def _on_render_done(self, cancel, paths, error, cancelled, warning=None):
+        """
+        Finaliza uma geração no thread da interface e informa o resultado ao usuário.
+
+        warning é o aviso do ajuste automático quando o currículo não coube no número
+        de páginas pedido.
+        """
+        self._render_jobs.discard(cancel)
+        if not self._render_jobs:
+            self.cancel_button.config(state=tk.DISABLED)
+        if cancel is self._current_render_job:
+            self.progress_bar["value"] = 0 if (error or cancelled) else 100
+            self.status_label.config(text="Geração cancelada." if cancelled else warning or "")
+
+        if cancelled:
+            return
+        if error is not None:
+            messagebox.showerror("Erro ao Gerar PDF", f"Ocorreu um erro: {error}\nVerifique os dados e tente novamente.")
+        elif warning:
+            messagebox.showwarning("Currículo Salvo com Aviso", warning + "\n\nCurrículo salvo em:\n" + "\n".join(paths))
+        else:
+            messagebox.showinfo("Sucesso", "Currículo salvo em:\n" + "\n".join(paths))
 
 # ----- INICIALIZAÇÃO DA APLICAÇÃO -----
-if __name__ == "__main__":
+def _export_formats(value):
+    """Converte "txt,docx" na lista de formatos, validando cada um (argparse)."""
+    from export import format_extension
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    try:
+        for name in names:
+            format_extension(name)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return names
+
+
+def main(argv=None):
+    """Inicia a interface gráfica ou, com --batch, gera currículos em lote pela linha de comando."""
+    parser = argparse.ArgumentParser(description="Construtor de Currículo ATS-Friendly")
+    parser.add_argument("--batch", metavar="ARQUIVO", help="Arquivo .jsonl ou .csv com um currículo por registro (modo em lote, sem interface gráfica).")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="Formato do arquivo de entrada (padrão: deduzido da extensão).")
+    parser.add_argument("--output-dir", default="curriculos", help="Diretório de saída dos PDFs (padrão: %(default)s).")
+    parser.add_argument("--manifest", help="Manifesto JSONL com o resultado de cada registro (padrão: manifest.jsonl no diretório de saída).")
+    parser.add_argument("--workers", type=int, help="Número de processos de geração (padrão: número de CPUs).")
+    parser.add_argument("--max-in-flight", type=int, help="Máximo de registros pendentes na fila (padrão: 4 por processo).")
+    parser.add_argument("--serve", action="store_true", help="Inicia o serviço HTTP local de geração (POST /render, GET /health).")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço do serviço HTTP (padrão: %(default)s).")
+    parser.add_argument("--port", type=int, default=8000, help="Porta do serviço HTTP (padrão: %(default)s).")
+    parser.add_argument("--queue-size", type=int, help="Máximo de pedidos em andamento no serviço antes de responder 429 (padrão: 4 por processo).")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Tempo máximo de geração de cada PDF no serviço, em segundos (padrão: %(default)s).")
+    parser.add_argument("--cache-dir", help="Diretório do cache em disco de PDFs já gerados (modo em lote).")
+    parser.add_argument("--cache-max-mb", type=int, default=512, help="Tamanho máximo do cache em disco, em MB (padrão: %(default)s).")
+    parser.add_argument("--export", metavar="FORMATOS", type=_export_formats, default=[], help="Formatos gerados além do PDF no modo em lote, separados por vírgula: txt, docx, json.")
+    parser.add_argument("--trace", metavar="ARQUIVO", help="Grava em JSONL o registro de instrumentação de cada PDF (fases, seções, páginas, bytes).")
+    parser.add_argument("--profile-slowest", type=int, default=0, metavar="N", help="Guarda o perfil cProfile das N gerações mais lentas (por processo, no modo em lote).")
+    parser.add_argument("--profile-dir", help="Diretório dos perfis .prof (padrão: perfis/, ou perfis/ no diretório de saída do lote).")
+    parser.add_argument("--virtualized", action="store_true", help="Usa listas virtualizadas de experiências e formações (currículos muito longos).")
+    parser.add_argument("--startup-time", action="store_true", help="Mede o tempo até a janela ser exibida, imprime e encerra.")
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        from batch import run_batch
+        counts = run_batch(args.batch, args.output_dir, args.manifest, args.workers, args.max_in_flight, args.format,
+                           cache_dir=args.cache_dir, cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+                           trace_path=args.trace, profile_slowest=args.profile_slowest, profile_dir=args.profile_dir,
+                           formats=args.export)
+        print(f"{counts['ok']} currículo(s) gerado(s), {counts['erro']} com erro.")
+        return 1 if counts["erro"] else 0
+
+    if args.serve:
+        from service import serve
+        serve(args.host, args.port, args.workers, args.queue_size, args.timeout)
+        return 0
+
+    instrumentation = None
+    if args.trace or args.profile_slowest:
+        from instrumentation import Instrumentation, JsonLinesWriter, only_errors
+        sink = JsonLinesWriter(args.trace) if args.trace else only_errors(JsonLinesWriter(sys.stderr))
+        profile_dir = (args.profile_dir or "perfis") if args.profile_slowest else None
+        instrumentation = Instrumentation([sink], args.profile_slowest, profile_dir)
+
     root = tk.Tk()
-    app = ResumeBuilderApp(root)
-    root.mainloop()
\ No newline at end of file
+    app = ResumeBuilderApp(root, virtualized=args.virtualized, instrumentation=instrumentation)
+    root.after_idle(app.on_window_shown, args.startup_time)
+    root.mainloop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,110 @@
+# ----- IMPORTAÇÕES -----
+from dataclasses import dataclass
+from models import Resume, split_skills
+
+# Representação intermediária do currículo, comum ao PDF e aos demais formatos de
+# exportação. Document.from_resume aplica, em um único lugar, as regras de
+# apresentação (entradas omitidas, bullets, lista de habilidades); engine.build_story
+# e os backends de export.py apenas percorrem as seções. Assim como models.py, não
+# depende do Tkinter nem do ReportLab.
+
+
+# ----- REPRESENTAÇÃO INTERMEDIÁRIA -----
+@dataclass(frozen=True, slots=True)
+class Block:
+    """Um parágrafo de texto ou um item de lista (bullet)."""
+    text: str
+    bullet: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    """Uma experiência ou formação: título, organização, local, período e descrição."""
+    titulo: str
+    organizacao: str = ""
+    local: str = ""
+    inicio: str = ""
+    fim: str = ""
+    periodo: str = ""
+    blocos: tuple = ()
+
+    @property
+    def detalhes(self):
+        """Organização, local e período preenchidos, na ordem exibida no PDF."""
+        return tuple(value for value in (self.organizacao, self.local, self.periodo) if value)
+
+
+@dataclass(frozen=True, slots=True)
+class Section:
+    """Uma seção do currículo, com blocos de texto (resumo, habilidades) ou entradas."""
+    chave: str
+    titulo: str
+    blocos: tuple = ()
+    entradas: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Document:
+    """Representação intermediária do currículo, comum a todos os formatos (imutável e hasheável)."""
+    nome: str
+    email: str
+    telefone: str
+    linkedin: str
+    secoes: tuple
+
+    @property
+    def contato(self):
+        """Email, telefone e LinkedIn preenchidos."""
+        return tuple(value for value in (self.email, self.telefone, self.linkedin) if value)
+
+    @classmethod
+    def from_resume(cls, resume):
+        """
+        Organiza o currículo em seções, com as mesmas regras do PDF.
+
+        Experiências sem cargo nem empresa e formações sem curso nem instituição são
+        omitidas; linhas da descrição iniciadas por "-" viram itens de lista.
+
+        Args:
+            resume (Resume | dict): Os dados do currículo.
+
+        Returns:
+            Document: A representação intermediária.
+        """
+        if isinstance(resume, dict):
+            resume = Resume.from_dict(resume)
+        secoes = []
+        if resume.resumo:
+            secoes.append(Section("resumo", "RESUMO PROFISSIONAL", blocos=(Block(resume.resumo),)))
+
+        experiencias = tuple(
+            Entry(exp.cargo, exp.empresa, exp.local, exp.data_inicio, exp.data_fim,
+                  f"{exp.data_inicio} - {exp.data_fim}" if exp.data_inicio or exp.data_fim else "",
+                  _description_blocks(exp.descricao))
+            for exp in resume.experiencias if exp.cargo or exp.empresa)
+        if experiencias:
+            secoes.append(Section("experiencia", "EXPERIÊNCIA PROFISSIONAL", entradas=experiencias))
+
+        educacao = tuple(
+            Entry(edu.curso, edu.instituicao, edu.local_edu, fim=edu.data_conclusao, periodo=edu.data_conclusao,
+                  blocos=(Block(edu.detalhes_edu),) if edu.detalhes_edu else ())
+            for edu in resume.educacao if edu.curso or edu.instituicao)
+        if educacao:
+            secoes.append(Section("educacao", "FORMAÇÃO ACADÊMICA", entradas=educacao))
+
+        if resume.habilidades:
+            secoes.append(Section("habilidades", "HABILIDADES",
+                                  blocos=tuple(Block(skill, bullet=True) for skill in split_skills(resume.habilidades))))
+        return cls(resume.nome_completo, resume.email, resume.telefone, resume.linkedin, tuple(secoes))
+
+
+def _description_blocks(descricao):
+    """Separa a descrição em parágrafos e itens (linhas iniciadas por "-")."""
+    blocks = []
+    for line in descricao.split("\n"):
+        line = line.strip()
+        if line.startswith("-"):
+            blocks.append(Block(line[1:].strip(), bullet=True))
+        elif line:
+            blocks.append(Block(line))
+    return tuple(blocks)
@@ -0,0 +1,494 @@
+# ----- IMPORTAÇÕES -----
+import copy
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import MappingProxyType
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, HRFlowable
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.enums import TA_CENTER
+from reportlab.lib.units import inch
+from reportlab.lib import colors
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from models import Resume, Experience, Education, split_skills
+from document import Document
+from fileio import atomic_write
+
+# Motor de renderização independente da interface gráfica: não importa tkinter
+# nem a classe ResumeBuilderApp, para que o currículo possa ser gerado em
+# servidores sem display.
+
+# ----- ESTILOS -----
+# Versão do layout e dos estilos do PDF. Altere-a sempre que a aparência do
+# documento mudar, para invalidar os PDFs guardados em cache em disco.
+TEMPLATE_VERSION = "1"
+
+# Fontes padrão (Type 1, não incorporadas) usadas pelos estilos do currículo.
+BASE_FONTS = MappingProxyType({"normal": "Helvetica", "bold": "Helvetica-Bold", "italic": "Helvetica-Oblique"})
+
+
+def setup_custom_styles(styles, fonts=BASE_FONTS):
+    """
+    Configura estilos personalizados para o PDF.
+
+    Args:
+        styles (StyleSheet1): Folha de estilos que receberá os estilos do currículo.
+        fonts (Mapping): Nomes das fontes "normal", "bold" e "italic".
+    """
+    styles.add(ParagraphStyle(name='NomeCandidato',
+                              fontName=fonts['bold'],
+                              fontSize=18,
+                              leading=22,
+                              alignment=TA_CENTER,
+                              spaceAfter=6))
+    styles.add(ParagraphStyle(name='ContatoInfo',
+                              fontName=fonts['normal'],
+                              fontSize=10,
+                              leading=12,
+                              alignment=TA_CENTER,
+                              spaceAfter=12))
+    styles.add(ParagraphStyle(name='SecaoTitulo',
+                              fontName=fonts['bold'],
+                              fontSize=14,
+                              leading=18,
+                              spaceBefore=12,
+                              spaceAfter=6))
+    styles.add(ParagraphStyle(name='SubTitulo',
+                              fontName=fonts['bold'],
+                              fontSize=11,
+                              leading=14,
+                              spaceAfter=2))
+    styles.add(ParagraphStyle(name='Detalhes',
+                              fontName=fonts['italic'],
+                              fontSize=10,
+                              leading=12,
+                              spaceAfter=2))
+    styles.add(ParagraphStyle(name='CorpoTexto',
+                              fontName=fonts['normal'],
+                              fontSize=10,
+                              leading=12,
+                              bulletIndent=18,
+                              leftIndent=18,
+                              spaceAfter=6))
+    styles.add(ParagraphStyle(name='BulletPoints',
+                              parent=styles['CorpoTexto'],
+                              bulletIndent=20,
+                              leftIndent=20,
+                              spaceBefore=0,
+                              spaceAfter=2))
+    return styles
+
+
+# Estilos criados por setup_custom_styles (os únicos usados na story do currículo).
+CUSTOM_STYLE_NAMES = ("NomeCandidato", "ContatoInfo", "SecaoTitulo", "SubTitulo", "Detalhes", "CorpoTexto", "BulletPoints")
+
+
+def build_styles(fonts=BASE_FONTS):
+    """Cria uma folha de estilos nova (e modificável) com os estilos personalizados do currículo."""
+    return setup_custom_styles(getSampleStyleSheet(), fonts)
+
+
+# ----- REGISTRO COMPARTILHADO DE ESTILOS E FONTES -----
+# Estilos e fontes são montados uma única vez por processo e compartilhados por
+# todas as renderizações (inclusive em threads diferentes), em vez de recriados
+# a cada currículo ou a cada instância da interface.
+_registry_lock = threading.Lock()
+_style_registry = {}
+_font_families = {}
+
+
+def register_font_family(family, normal, bold=None, italic=None, bold_italic=None):
+    """
+    Registra uma família de fontes TrueType (uma única vez por processo).
+
+    As fontes TrueType são incorporadas ao PDF apenas com os glifos usados
+    (subsetting), o que mantém os arquivos pequenos.
+
+    Args:
+        family (str): Nome da família (ex.: "DejaVuSans").
+        normal (str): Caminho do arquivo .ttf da variante normal.
+        bold, italic, bold_italic (str, opcional): Caminhos das demais variantes;
+            quando omitidas, usa-se a variante normal (ou a negrito, para bold_italic).
+
+    Returns:
+        str: O nome da família, para uso em get_styles(font_family=...).
+    """
+    with _registry_lock:
+        if family in _font_families:
+            return family
+
+        paths = {"normal": normal, "bold": bold, "italic": italic, "boldItalic": bold_italic}
+        names = {}
+        for variant, path in paths.items():
+            if path:
+                names[variant] = family if variant == "normal" else f"{family}-{variant}"
+                pdfmetrics.registerFont(TTFont(names[variant], path))
+        names.setdefault("bold", names["normal"])
+        names.setdefault("italic", names["normal"])
+        names.setdefault("boldItalic", names["bold"])
+
+        addMapping(family, 0, 0, names["normal"])
+        addMapping(family, 1, 0, names["bold"])
+        addMapping(family, 0, 1, names["italic"])
+        addMapping(family, 1, 1, names["boldItalic"])
+        _font_families[family] = MappingProxyType(names)
+    return family
+
+
+class FrozenParagraphStyle(ParagraphStyle):
+    """
+    Estilo somente leitura do registro compartilhado (get_styles).
+
+    Alterar um atributo levanta AttributeError: uma mudança afetaria todas as
+    renderizações seguintes do processo e as entradas do cache de flowables.
+    clone() devolve um ParagraphStyle comum, que pode ser modificado.
+    """
+
+    def __init__(self, style):
+        self.__dict__.update(vars(style))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"O estilo compartilhado {self.name!r} é somente leitura; "
+                             "use style.clone() ou build_styles() para modificá-lo.")
+
+    def __delattr__(self, name):
+        self.__setattr__(name, None)
+
+    def clone(self, name, parent=None, **kwds):
+        style = ParagraphStyle(name)
+        style.__dict__.update(vars(self))
+        style.name = name
+        style.parent = parent or self
+        style._setKwds(**kwds)
+        return style
+
+
+def freeze_styles(styles):
+    """Converte uma folha de estilos em um mapeamento somente leitura de estilos somente leitura."""
+    frozen = {name: FrozenParagraphStyle(style) if isinstance(style, ParagraphStyle) else style
+              for name, style in styles.items()}
+    # Os pais passam a apontar para as cópias somente leitura.
+    for style in frozen.values():
+        parent = getattr(style, "parent", None)
+        if isinstance(style, FrozenParagraphStyle) and parent is not None:
+            style.__dict__["parent"] = frozen.get(parent.name, parent)
+    return MappingProxyType(frozen)
+
+
+def get_styles(font_family=None):
+    """
+    Retorna a folha de estilos compartilhada do currículo, criada na primeira chamada.
+
+    O resultado é um mapeamento somente leitura, compartilhado por todo o processo,
+    e os próprios estilos também são somente leitura (FrozenParagraphStyle); para
+    modificar estilos, use build_styles() ou style.clone() e passe a cópia para render().
+
+    Args:
+        font_family (str, opcional): Família registrada com register_font_family;
+            padrão: Helvetica.
+
+    Returns:
+        Mapping: Estilos por nome ("NomeCandidato", "SecaoTitulo", ...).
+    """
+    styles = _style_registry.get(font_family)
+    if styles is None:
+        with _registry_lock:
+            styles = _style_registry.get(font_family)
+            if styles is None:
+                if font_family is None:
+                    fonts = BASE_FONTS
+                elif font_family in _font_families:
+                    fonts = _font_families[font_family]
+                else:
+                    raise ValueError(f"Família de fontes não registrada: {font_family}")
+                styles = freeze_styles(build_styles(fonts).byName)
+                _style_registry[font_family] = styles
+    return styles
+
+
+# ----- FÁBRICAS DE FLOWABLES -----
+# Os flowables guardam estado de cada geração (canvas, frame), então não podem ser
+# compartilhados entre renderizações; o que é compartilhado são os parâmetros.
+SECTION_RULE = MappingProxyType(dict(width="100%", thickness=0.5, color=colors.grey, spaceBefore=1, spaceAfter=1))
+SUMMARY_RULE = MappingProxyType(dict(SECTION_RULE, hAlign='LEFT', vAlign='BOTTOM', lineCap='round'))
+SECTION_SPACING = 0.1*inch
+
+
+def section_header(title, styles, rule=SECTION_RULE):
+    """Cria o título de uma seção seguido da linha separadora."""
+    return [Paragraph(title, styles['SecaoTitulo']), HRFlowable(**rule)]
+
+
+def section_spacer():
+    """Cria o espaço vertical que encerra cada seção ou entrada."""
+    return Spacer(1, SECTION_SPACING)
+
+
+# ----- CACHE DE FLOWABLES POR SEÇÃO -----
+class FlowableCache:
+    """
+    Cache LRU limitado dos flowables gerados para cada seção do currículo.
+
+    A chave combina o conteúdo da seção (os modelos são imutáveis e hasheáveis)
+    com a folha de estilos usada. Em um acerto, o cache devolve cópias rasas dos
+    flowables guardados: o texto já interpretado dos Paragraphs é reaproveitado,
+    mas cada renderização recebe instâncias próprias, pois os flowables guardam
+    estado da geração (canvas, frame).
+    """
+
+    def __init__(self, maxsize=512):
+        """
+        Args:
+            maxsize (int): Número máximo de seções guardadas.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, styles, builder):
+        """
+        Retorna os flowables da seção, gerando-os com builder() em caso de falta.
+
+        Args:
+            key (tuple): Identifica a seção e o seu conteúdo.
+            styles (Mapping): Estilos usados pelo builder.
+            builder (callable): Gera a lista de flowables da seção.
+
+        Returns:
+            list: Flowables novos, prontos para entrar na story.
+        """
+        key = (id(styles), key)
+        with self._lock:
+            entry = self._entries.get(key)
+            # A entrada guarda a própria folha de estilos, o que impede que o id seja reutilizado
+            if entry is not None and entry[0] is styles:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [copy.copy(flowable) for flowable in entry[1]]
+            self.misses += 1
+
+        flowables = builder()
+        with self._lock:
+            self._entries[key] = (styles, flowables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return [copy.copy(flowable) for flowable in flowables]
+
+    def stats(self):
+        """Retorna os contadores de acertos e faltas e a ocupação do cache."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        """Esvazia o cache e zera os contadores."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+# Cache compartilhado por todas as renderizações do processo.
+flowable_cache = FlowableCache()
+
+
+# ----- CONSTRUÇÃO DO DOCUMENTO -----
+# As regras de apresentação (entradas omitidas, bullets, habilidades) ficam em
+# Document.from_resume; os builders abaixo apenas convertem cada parte do Document
+# em flowables.
+def _header_flowables(document, styles):
+    """Nome e contato."""
+    flowables = []
+    if document.nome:
+        flowables.append(Paragraph(document.nome.upper(), styles['NomeCandidato']))
+
+    if document.contato:
+        flowables.append(Paragraph(" | ".join(document.contato), styles['ContatoInfo']))
+    flowables.append(section_spacer())
+    return flowables
+
+
+def _block_flowable(block, styles):
+    """Um parágrafo de texto ou um item de lista."""
+    if block.bullet:
+        return Paragraph(block.text, styles['BulletPoints'], bulletText='•')
+    return Paragraph(block.text, styles['CorpoTexto'])
+
+
+def _section_flowables(section, styles):
+    """Seção formada por blocos de texto (resumo, habilidades)."""
+    rule = SUMMARY_RULE if section.chave == "resumo" else SECTION_RULE
+    return [*section_header(section.titulo, styles, rule),
+            *(_block_flowable(block, styles) for block in section.blocos),
+            section_spacer()]
+
+
+def _entry_flowables(entry, styles):
+    """Uma entrada de experiência profissional ou de formação acadêmica."""
+    flowables = [Paragraph(entry.titulo.upper(), styles['SubTitulo'])]
+    if entry.detalhes:
+        flowables.append(Paragraph(" | ".join(entry.detalhes), styles['Detalhes']))
+    flowables.extend(_block_flowable(block, styles) for block in entry.blocos)
+    flowables.append(section_spacer())
+    return flowables
+
+
+def build_story(resume, styles=None, cache=flowable_cache, trace=None):
+    """
+    Monta a lista de flowables (story) do currículo a partir do Document.
+
+    Cada parte do Document (cabeçalho, seções de texto, cada entrada) passa pelo
+    cache, indexada pelos próprios objetos imutáveis, de modo que uma nova
+    renderização só reconstrói as partes cujo conteúdo mudou.
+
+    Args:
+        resume (Resume | Document): Os dados do currículo, ou a representação já montada.
+        styles (Mapping, opcional): Estilos; padrão: get_styles().
+        cache (FlowableCache, opcional): Cache de seções; None desativa o cache.
+        trace (RenderTrace, opcional): Recebe o tempo e o número de flowables de cada seção.
+
+    Returns:
+        list: Os flowables prontos para SimpleDocTemplate.build.
+    """
+    if styles is None:
+        styles = get_styles()
+    document = resume if isinstance(resume, Document) else Document.from_resume(resume)
+
+    def section(key, builder, *args):
+        start = time.perf_counter() if trace is not None else 0.0
+        if cache is None:
+            flowables = builder(*args, styles)
+        else:
+            flowables = cache.get(key, styles, lambda: builder(*args, styles))
+        if trace is not None:
+            trace.add_section(key[0], len(flowables), time.perf_counter() - start)
+        return flowables
+
+    # --- Nome e Contato ---
+    story = section(("cabecalho", document.nome, document.contato), _header_flowables, document)
+
+    for part in document.secoes:
+        if part.entradas:
+            # --- Experiência / Educação: título da seção e uma parte por entrada ---
+            story.extend(section(("titulo", part.titulo), section_header, part.titulo))
+            for entry in part.entradas:
+                story.extend(section((part.chave, entry), _entry_flowables, entry))
+        else:
+            # --- Resumo / Habilidades ---
+            story.extend(section((part.chave, part), _section_flowables, part))
+
+    return story
+
+
+def make_doc_template(out, doc_class=SimpleDocTemplate):
+    """Cria o documento (SimpleDocTemplate, por padrão) com o tamanho de página e margens do currículo."""
+    return doc_class(out, pagesize=letter,
+                     rightMargin=0.75*inch, leftMargin=0.75*inch,
+                     topMargin=0.75*inch, bottomMargin=0.75*inch)
+
+
+class RenderCancelled(Exception):
+    """Sinaliza que a geração do PDF foi cancelada antes de terminar."""
+
+
+def render(resume, out, styles=None, progress=None, cancel=None, cache=flowable_cache, trace=None):
+    """
+    Gera o PDF do currículo.
+
+    Args:
+        resume (Resume | dict | Document): Os dados do currículo.
+        out (str | file): Caminho do arquivo ou objeto binário gravável (ex.: BytesIO).
+        styles (Mapping, opcional): Estilos; padrão: get_styles().
+        progress (callable, opcional): Recebe a fração concluída, de 0.0 a 1.0.
+        cancel (threading.Event, opcional): Quando sinalizado, interrompe a geração
+            levantando RenderCancelled.
+        cache (FlowableCache, opcional): Cache de seções; None desativa o cache.
+        trace (RenderTrace, opcional): Recebe a duração das fases "story", "layout" e
+            "write", o número de flowables e de páginas e o tamanho do PDF. Com um
+            caminho em out, o PDF é montado em memória e gravado na fase "write".
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    if trace is None:
+        doc = make_doc_template(out)
+        story = build_story(resume, styles, cache)
+        _build(doc, story, progress, cancel)
+        return
+
+    target = io.BytesIO() if isinstance(out, (str, os.PathLike)) else out
+    doc = make_doc_template(target)
+    with trace.phase("story"):
+        story = build_story(resume, styles, cache, trace)
+    trace.set(flowables=len(story))
+    with trace.phase("layout"):
+        _build(doc, story, progress, cancel)
+    trace.set(pages=doc.page)
+    if target is not out:
+        with trace.phase("write"):
+            atomic_write(out, target.getvalue())
+        trace.set(output_bytes=target.tell())
+    elif hasattr(out, "tell"):
+        trace.set(output_bytes=out.tell())
+
+
+def _build(doc, story, progress=None, cancel=None):
+    """Executa doc.build, instalando o callback de progresso/cancelamento quando pedido."""
+    if progress is not None or cancel is not None:
+        total = [max(len(story), 1)]
+
+        def on_progress(typ, value):
+            if cancel is not None and cancel.is_set():
+                raise RenderCancelled()
+            if typ == 'SIZE_EST':
+                total[0] = max(value, 1)
+            elif typ == 'PROGRESS' and progress is not None:
+                progress(min(value / total[0], 1.0))
+
+        doc.setProgressCallBack(on_progress)
+    doc.build(story)
+
+
+# ----- PRÉ-VISUALIZAÇÃO -----
+@dataclass(frozen=True, slots=True)
+class Preview:
+    """Resultado de uma pré-visualização: o PDF em memória e o texto de cada página."""
+    pdf: bytes
+    page_count: int
+    pages: tuple
+
+
+class _PreviewDocTemplate(SimpleDocTemplate):
+    """SimpleDocTemplate que registra o texto dos parágrafos desenhados em cada página."""
+
+    def afterFlowable(self, flowable):
+        if isinstance(flowable, Paragraph):
+            self.preview_pages.setdefault(self.page, []).append(flowable.getPlainText())
+
+
+def render_preview(resume, styles=None, cache=flowable_cache):
+    """
+    Gera o currículo em memória para pré-visualização.
+
+    Args:
+        resume (Resume | dict | Document): Os dados do currículo.
+        styles (Mapping, opcional): Estilos; padrão: get_styles().
+        cache (FlowableCache, opcional): Cache de seções; None desativa o cache.
+
+    Returns:
+        Preview: O PDF gerado, o número de páginas e as linhas de texto de cada página.
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    buffer = io.BytesIO()
+    doc = make_doc_template(buffer, _PreviewDocTemplate)
+    doc.preview_pages = {}
+    doc.build(build_story(resume, styles, cache))
+    pages = tuple(tuple(doc.preview_pages.get(number, ())) for number in range(1, doc.page + 1))
+    return Preview(pdf=buffer.getvalue(), page_count=doc.page, pages=pages)
@@ -0,0 +1,347 @@
+# ----- IMPORTAÇÕES -----
+import io
+import json
+import re
+import threading
+import unicodedata
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
+from document import Document
+from fileio import atomic_write
+
+# Exportação em vários formatos a partir de uma única representação intermediária.
+#
+# Document.from_resume (document.py) organiza o currículo uma única vez em seções,
+# entradas e blocos de texto. Cada formato, inclusive o PDF, é produzido por um
+# backend registrado com register_backend; export_bytes executa os backends
+# pedidos em paralelo, sobre o mesmo Document.
+#
+#   export(resume, ("pdf", "txt", "docx", "json"), "saida/curriculo")
+#   -> {"pdf": "saida/curriculo.pdf", "txt": "saida/curriculo.txt", ...}
+
+
+# ----- REGISTRO DE BACKENDS -----
+_backends_lock = threading.Lock()
+_backends = {}
+
+
+def register_backend(name, extension, function):
+    """
+    Registra um formato de exportação.
+
+    Args:
+        name (str): Nome do formato (ex.: "txt").
+        extension (str): Extensão dos arquivos gerados (ex.: ".txt").
+        function (callable): function(document, out, **options) grava o arquivo no
+            objeto binário out.
+    """
+    with _backends_lock:
+        _backends[name] = (extension, function)
+
+
+def available_formats():
+    """Retorna os nomes dos formatos registrados."""
+    with _backends_lock:
+        return tuple(_backends)
+
+
+def format_extension(name):
+    """Retorna a extensão dos arquivos do formato; ValueError se ele não estiver registrado."""
+    return _backend(name)[0]
+
+
+def _backend(name):
+    with _backends_lock:
+        if name not in _backends:
+            raise ValueError(f"Formato desconhecido: {name!r} (disponíveis: {', '.join(_backends)}).")
+        return _backends[name]
+
+
+# ----- BACKENDS -----
+def write_pdf(document, out, styles=None, **options):
+    """PDF, com o motor e os estilos do ReportLab (options: progress, cancel, trace, cache)."""
+    from engine import render
+    render(document, out, styles, **options)
+
+
+def write_text(document, out):
+    """Texto simples em UTF-8, para portais que pedem o currículo colado em um campo."""
+    lines = []
+    if document.nome:
+        lines.append(document.nome.upper())
+    if document.contato:
+        lines.append(" | ".join(document.contato))
+    for section in document.secoes:
+        lines += ["", section.titulo, "=" * len(section.titulo)]
+        lines += [_text_block(block) for block in section.blocos]
+        for number, entry in enumerate(section.entradas):
+            if number:
+                lines.append("")
+            lines.append(entry.titulo.upper())
+            if entry.detalhes:
+                lines.append(" | ".join(entry.detalhes))
+            lines += [_text_block(block) for block in entry.blocos]
+    out.write(("\n".join(lines) + "\n").encode("utf-8"))
+
+
+def _text_block(block):
+    return f"• {block.text}" if block.bullet else block.text
+
+
+def write_json_resume(document, out):
+    """
+    JSON Resume (jsonresume.org).
+
+    As datas são convertidas para o formato ISO 8601 exigido pelo esquema (ver
+    iso_date); datas que não puderem ser interpretadas são omitidas.
+    """
+    basics = {"name": document.nome, "email": document.email, "phone": document.telefone}
+    if document.linkedin:
+        basics["profiles"] = [{"network": "LinkedIn", "url": document.linkedin}]
+    data = {"basics": {key: value for key, value in basics.items() if value}}
+
+    sections = {section.chave: section for section in document.secoes}
+    if "resumo" in sections:
+        data["basics"]["summary"] = sections["resumo"].blocos[0].text
+    if "experiencia" in sections:
+        data["work"] = [_json_entry({"position": entry.titulo, "name": entry.organizacao, "location": entry.local,
+                                     "startDate": iso_date(entry.inicio), "endDate": iso_date(entry.fim),
+                                     "summary": "\n".join(b.text for b in entry.blocos if not b.bullet),
+                                     "highlights": [b.text for b in entry.blocos if b.bullet]})
+                        for entry in sections["experiencia"].entradas]
+    if "educacao" in sections:
+        data["education"] = [_json_entry({"area": entry.titulo, "institution": entry.organizacao,
+                                          "location": entry.local, "endDate": iso_date(entry.fim),
+                                          **_education_details(entry.blocos)})
+                             for entry in sections["educacao"].entradas]
+    if "habilidades" in sections:
+        data["skills"] = [{"name": block.text} for block in sections["habilidades"].blocos]
+    out.write(json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8"))
+
+
+def _json_entry(entry):
+    return {key: value for key, value in entry.items() if value}
+
+
+_MONTHS = {name: number for number, names in enumerate(
+    (("jan", "janeiro", "january"), ("fev", "fevereiro", "feb", "february"), ("mar", "marco", "march"),
+     ("abr", "abril", "apr", "april"), ("mai", "maio", "may"), ("jun", "junho", "june"),
+     ("jul", "julho", "july"), ("ago", "agosto", "aug", "august"), ("set", "setembro", "sep", "sept", "september"),
+     ("out", "outubro", "oct", "october"), ("nov", "novembro", "november"), ("dez", "dezembro", "dec", "december")),
+    start=1) for name in names}
+_DATE_FORMATS = (
+    (re.compile(r"(\d{1,2})[/.\-](\d{4})"), lambda m: (m[2], m[1])),          # 03/2020
+    (re.compile(r"(\d{4})[/.\-](\d{1,2})"), lambda m: (m[1], m[2])),          # 2020-03
+    (re.compile(r"(\d{4})-(\d{2})-(\d{2})"), lambda m: (m[1], m[2], m[3])),   # 2020-03-15
+    (re.compile(r"([a-z]+)\.?(?:/|\s+de\s+|\s+)(\d{4})"),                    # mar/2020, março de 2020
+     lambda m: (m[2], _MONTHS.get(m[1]))),
+    (re.compile(r"(\d{4})"), lambda m: (m[1],)),                                # 2020
+)
+
+
+def iso_date(text):
+    """
+    Converte uma data digitada ("03/2020", "mar/2020", "março de 2020", "2020") para
+    ISO 8601 ("2020-03", "2020"); retorna "" se ela não puder ser interpretada
+    (inclusive "Atual"/"Presente", que no JSON Resume se representa omitindo a data).
+    """
+    text = unicodedata.normalize("NFKD", text.strip().casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    for pattern, parts in _DATE_FORMATS:
+        match = pattern.fullmatch(text)
+        if match:
+            year, *rest = parts(match)
+            if None in rest or not all(1 <= int(value) <= (12, 31)[i] for i, value in enumerate(rest)):
+                return ""
+            return "-".join([year, *(f"{int(value):02d}" for value in rest)])
+    return ""
+
+
+# Linhas dos detalhes da formação que indicam nota ou média (esquema: education[].score).
+_SCORE_RE = re.compile(r"\b(gpa|cr|cra|nota|media|média|coeficiente|score)\b.*\d|\d+[.,]\d+\s*/\s*\d+", re.IGNORECASE)
+
+
+def _education_details(blocks):
+    """Separa os detalhes da formação em nota/média ("score") e texto livre ("summary")."""
+    lines = [line.strip() for block in blocks for line in block.text.split("\n") if line.strip()]
+    return {"score": "; ".join(line for line in lines if _SCORE_RE.search(line)),
+            "summary": "\n".join(line for line in lines if not _SCORE_RE.search(line))}
+
+
+# DOCX mínimo (WordprocessingML), gerado só com a biblioteca padrão: parágrafos
+# simples com estilos nomeados, sem tabelas nem caixas de texto, que os ATS leem bem.
+_DOCX_CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+<Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>
+</Types>"""
+
+_DOCX_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+_DOCX_DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>
+</Relationships>"""
+
+
+def _docx_style(style_id, name, size, bold=False, color=None, center=False, before=0, after=0, indent=0, rule=False):
+    ppr = f'<w:spacing w:before="{before}" w:after="{after}"/>'
+    if center:
+        ppr += '<w:jc w:val="center"/>'
+    if indent:
+        ppr += f'<w:ind w:left="{indent}" w:hanging="{indent // 2}"/>'
+    if rule:
+        ppr += '<w:pBdr><w:bottom w:val="single" w:sz="6" w:space="1" w:color="808080"/></w:pBdr>'
+    rpr = ('<w:b/>' if bold else '') + (f'<w:color w:val="{color}"/>' if color else '') + f'<w:sz w:val="{size * 2}"/>'
+    return (f'<w:style w:type="paragraph" w:styleId="{style_id}"><w:name w:val="{name}"/>'
+            f'<w:basedOn w:val="Normal"/><w:pPr>{ppr}</w:pPr><w:rPr>{rpr}</w:rPr></w:style>')
+
+
+# Os tamanhos e espaçamentos seguem os estilos do PDF (setup_custom_styles).
+_DOCX_STYLES = ("""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Arial" w:hAnsi="Arial" w:cs="Arial"/>"""
+                """<w:sz w:val="20"/><w:lang w:val="pt-BR"/></w:rPr></w:rPrDefault></w:docDefaults>
+<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/>"""
+                """<w:pPr><w:spacing w:after="60"/></w:pPr></w:style>
+"""
+                + _docx_style("Title", "Title", 18, bold=True, center=True, after=80)
+                + _docx_style("Contato", "Contato", 9, center=True, after=240)
+                + _docx_style("Heading1", "heading 1", 12, bold=True, color="333333", before=240, after=120, rule=True)
+                + _docx_style("Heading2", "heading 2", 11, bold=True, before=120, after=20)
+                + _docx_style("Detalhes", "Detalhes", 9, color="555555", after=60)
+                + _docx_style("ListParagraph", "List Paragraph", 10, indent=360, after=40)
+                + "\n</w:styles>")
+
+
+# Caracteres de controle que o XML não aceita (o tab e as quebras de linha são aceitos).
+_XML_INVALID = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _docx_paragraph(text, style=None):
+    ppr = f'<w:pPr><w:pStyle w:val="{style}"/></w:pPr>' if style else ""
+    return f'<w:p>{ppr}<w:r><w:t xml:space="preserve">{escape(_XML_INVALID.sub("", text))}</w:t></w:r></w:p>'
+
+
+def write_docx(document, out):
+    """DOCX (Word), com estilos nomeados (Title, Heading1, Heading2) reconhecidos pelos ATS."""
+    body = []
+    if document.nome:
+        body.append(_docx_paragraph(document.nome.upper(), "Title"))
+    if document.contato:
+        body.append(_docx_paragraph(" | ".join(document.contato), "Contato"))
+    for section in document.secoes:
+        body.append(_docx_paragraph(section.titulo, "Heading1"))
+        body += [_docx_block(block) for block in section.blocos]
+        for entry in section.entradas:
+            body.append(_docx_paragraph(entry.titulo.upper(), "Heading2"))
+            if entry.detalhes:
+                body.append(_docx_paragraph(" | ".join(entry.detalhes), "Detalhes"))
+            body += [_docx_block(block) for block in entry.blocos]
+
+    # Carta (8,5" x 11") com margens de 0,75", como o PDF
+    section_properties = ('<w:sectPr><w:pgSz w:w="12240" w:h="15840"/>'
+                          '<w:pgMar w:top="1080" w:right="1080" w:bottom="1080" w:left="1080"'
+                          ' w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>')
+    xml = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+           '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+           + "".join(body) + section_properties + '</w:body></w:document>')
+
+    # Data fixa nas entradas do zip: o mesmo currículo gera sempre o mesmo arquivo
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as package:
+        for name, content in (("[Content_Types].xml", _DOCX_CONTENT_TYPES), ("_rels/.rels", _DOCX_RELS),
+                              ("word/_rels/document.xml.rels", _DOCX_DOCUMENT_RELS),
+                              ("word/styles.xml", _DOCX_STYLES), ("word/document.xml", xml)):
+            info = zipfile.ZipInfo(name, date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            package.writestr(info, content.encode("utf-8"))
+
+
+def _docx_block(block):
+    return _docx_paragraph(f"•\t{block.text}", "ListParagraph") if block.bullet else _docx_paragraph(block.text)
+
+
+register_backend("pdf", ".pdf", write_pdf)
+register_backend("txt", ".txt", write_text)
+register_backend("docx", ".docx", write_docx)
+register_backend("json", ".json", write_json_resume)
+
+
+# ----- EXPORTAÇÃO -----
+def export_bytes(resume, formats, options=None, max_workers=None):
+    """
+    Gera o currículo em vários formatos a partir de uma única representação intermediária.
+
+    Os backends são executados em paralelo sobre o mesmo Document. O PDF (ou, sem ele,
+    o primeiro formato) é gerado no thread que chamou a função, para que a
+    instrumentação e o cProfile desse thread o acompanhem; os demais, em threads.
+
+    Args:
+        resume (Resume | dict | Document): Os dados do currículo.
+        formats (iterable): Nomes dos formatos (ex.: ("pdf", "docx")).
+        options (dict, opcional): Argumentos extras por formato, ex.:
+            {"pdf": {"styles": estilos, "progress": callback, "cancel": evento}}.
+        max_workers (int, opcional): Máximo de threads para os demais formatos; padrão: um por formato.
+
+    Returns:
+        dict: Formato -> conteúdo do arquivo (bytes), na ordem pedida.
+
+    Raises:
+        ValueError: Se algum formato não estiver registrado.
+        Exception: O primeiro erro levantado por um backend (ex.: RenderCancelled).
+    """
+    document = resume if isinstance(resume, Document) else Document.from_resume(resume)
+    formats = list(dict.fromkeys(formats))
+    backends = {name: _backend(name)[1] for name in formats}
+    options = options or {}
+
+    def run(name):
+        buffer = io.BytesIO()
+        backends[name](document, buffer, **options.get(name, {}))
+        return buffer.getvalue()
+
+    local = "pdf" if "pdf" in backends else formats[0]
+    others = [name for name in formats if name != local]
+    if not others:
+        return {local: run(local)}
+    with ThreadPoolExecutor(max_workers=max_workers or len(others)) as pool:
+        futures = {name: pool.submit(run, name) for name in others}
+        results = {local: run(local)}
+        results.update((name, future.result()) for name, future in futures.items())
+    return {name: results[name] for name in formats}
+
+
+def export(resume, formats, base_path, options=None, max_workers=None):
+    """
+    Grava o currículo em vários formatos, em base_path + extensão de cada formato.
+
+    Os arquivos só são gravados depois que todos os formatos forem gerados, cada um
+    em um nome temporário renomeado ao final, para não deixar arquivos incompletos.
+
+    Args:
+        resume (Resume | dict | Document): Os dados do currículo.
+        formats (iterable): Nomes dos formatos.
+        base_path (str): Caminho sem extensão (ex.: "saida/curriculo").
+        options (dict, opcional): Argumentos extras por formato (ver export_bytes).
+        max_workers (int, opcional): Máximo de backends simultâneos.
+
+    Returns:
+        dict: Formato -> caminho do arquivo gravado.
+    """
+    return save(export_bytes(resume, formats, options, max_workers), base_path)
+
+
+def save(contents, base_path):
+    """Grava o resultado de export_bytes em base_path + extensão de cada formato."""
+    paths = {}
+    for name, data in contents.items():
+        path = base_path + format_extension(name)
+        atomic_write(path, data)
+        paths[name] = path
+    return paths
@@ -0,0 +1,125 @@
+# ----- IMPORTAÇÕES -----
+import csv
+import json
+import os
+import tempfile
+
+# Utilitários de arquivo (gravação atômica e leitura dos registros JSONL/CSV)
+# compartilhados pela interface, pelo lote, pelo cache, pela exportação e pela
+# comparação com vagas. Não depende do Tkinter nem do ReportLab.
+
+# Campos que, no CSV, contêm listas codificadas em JSON.
+LIST_FIELDS = ("experiencias", "educacao")
+# Tamanho máximo de um campo CSV (o padrão do módulo csv, 128 KB, é pequeno para
+# as colunas de experiências codificadas em JSON).
+CSV_FIELD_SIZE_LIMIT = 64 * 1024 * 1024
+
+# Permissões dos arquivos gravados por atomic_write: as de um open() comum (0o666
+# menos a umask), pois o mkstemp cria o temporário com 0o600.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+
+def atomic_write(path, data):
+    """
+    Grava data em path por meio de um arquivo temporário exclusivo no mesmo diretório.
+
+    O arquivo temporário é criado com mkstemp, de modo que gravações simultâneas no
+    mesmo destino (threads ou processos) nunca compartilham o temporário; o destino
+    é substituído de uma vez por os.replace e nunca fica incompleto. O arquivo final
+    recebe as permissões de um arquivo criado com open().
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def iter_records(input_path, input_format=None):
+    """
+    Lê os registros do arquivo de entrada um a um, sem carregá-lo inteiro na memória.
+
+    Um registro ilegível (UTF-8 inválido, JSON ou CSV malformado) gera uma mensagem
+    de erro e a leitura continua no registro seguinte.
+
+    Args:
+        input_path (str): Caminho do arquivo .jsonl ou .csv.
+        input_format (str, opcional): "jsonl" ou "csv"; deduzido da extensão se omitido.
+
+    Yields:
+        tuple: (número do registro, dicionário de dados ou None, mensagem de erro ou None).
+    """
+    if input_format is None:
+        input_format = "csv" if input_path.lower().endswith(".csv") else "jsonl"
+
+    # O arquivo é lido em bytes e cada linha é decodificada separadamente, para que
+    # um byte inválido afete apenas o registro em que aparece.
+    with open(input_path, "rb") as f:
+        if input_format == "csv":
+            yield from _iter_csv(f)
+        else:
+            number = 0
+            for line in f:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    record = json.loads(line.decode("utf-8"))
+                except UnicodeDecodeError as e:
+                    yield number, None, f"UTF-8 inválido: {e}"
+                    continue
+                except ValueError as e:
+                    yield number, None, f"JSON inválido: {e}"
+                    continue
+                if isinstance(record, dict):
+                    yield number, record, None
+                else:
+                    yield number, None, "O registro não é um objeto JSON."
+
+
+def _iter_csv(f):
+    """Lê os registros de um CSV aberto em modo binário (ver iter_records)."""
+    if csv.field_size_limit() < CSV_FIELD_SIZE_LIMIT:
+        csv.field_size_limit(CSV_FIELD_SIZE_LIMIT)
+    decode_errors = []
+
+    def lines():
+        for raw in f:
+            try:
+                yield raw.decode("utf-8")
+            except UnicodeDecodeError as e:
+                decode_errors.append(e)
+                yield raw.decode("utf-8", "replace")
+
+    reader = csv.DictReader(lines())
+    number = 0
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            number += 1
+            decode_errors.clear()
+            yield number, None, f"CSV inválido: {e}"
+            continue
+        number += 1
+        if decode_errors:
+            yield number, None, f"UTF-8 inválido: {decode_errors[0]}"
+            decode_errors.clear()
+            continue
+        try:
+            for name in LIST_FIELDS:
+                row[name] = json.loads(row[name]) if row.get(name) else []
+            yield number, row, None
+        except ValueError as e:
+            yield number, None, f"JSON inválido na coluna: {e}"
@@ -0,0 +1,206 @@
+# ----- IMPORTAÇÕES -----
+import cProfile
+import heapq
+import itertools
+import json
+import os
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+
+# Instrumentação da renderização: mede cada fase (coleta dos dados da UI, montagem
+# da story, layout do ReportLab, gravação em disco) e cada seção do currículo, e
+# entrega um registro estruturado (dict serializável em JSON) a callbacks
+# configuráveis. Opcionalmente, guarda o perfil (cProfile) das N renderizações
+# mais lentas.
+#
+#   instrumentation = Instrumentation([JsonLinesWriter("trace.jsonl")], profile_slowest=5)
+#   with instrumentation.trace(registro=42) as trace:
+#       render(resume, "saida.pdf", trace=trace)
+
+# Apenas um cProfile pode estar ativo por processo (no Python 3.12+, enable() com
+# outro perfil ativo levanta ValueError, pois sys.monitoring é global). Uma
+# renderização que começa enquanto outra está sendo perfilada não é perfilada.
+_profiler_lock = threading.Lock()
+
+
+class RenderTrace:
+    """Medições de uma renderização, preenchidas pelo motor durante a geração."""
+
+    def __init__(self, **context):
+        """
+        Args:
+            **context: Campos de identificação incluídos no registro (ex.: registro=42).
+        """
+        self.context = context
+        self.phases = {}
+        self.sections = {}
+        self.fields = {}
+        self.record = None
+
+    @contextmanager
+    def phase(self, name):
+        """Mede o tempo do bloco e o acumula na fase name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, time.perf_counter() - start)
+
+    def add_phase(self, name, seconds):
+        """
+        Acumula seconds na fase name.
+
+        Também serve para fases medidas antes do bloco trace (ex.: a leitura dos
+        widgets, que precisa ocorrer no thread da interface); estas não entram no
+        total "segundos" do registro.
+        """
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def add_section(self, kind, flowables, seconds):
+        """Registra a montagem de uma seção (ex.: "experiencia") com o número de flowables gerados."""
+        section = self.sections.setdefault(kind, {"quantidade": 0, "flowables": 0, "segundos": 0.0})
+        section["quantidade"] += 1
+        section["flowables"] += flowables
+        section["segundos"] += seconds
+
+    def set(self, **fields):
+        """Registra métricas avulsas (ex.: pages=2, output_bytes=18000)."""
+        self.fields.update(fields)
+
+    def to_dict(self):
+        """Retorna o registro estruturado da renderização."""
+        return {
+            **self.context,
+            **self.fields,
+            "fases": {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            "secoes": {kind: dict(section, segundos=round(section["segundos"], 6))
+                       for kind, section in self.sections.items()},
+        }
+
+
+class Instrumentation:
+    """Cria RenderTraces, entrega os registros aos callbacks e guarda os perfis mais lentos."""
+
+    def __init__(self, callbacks=(), profile_slowest=0, profile_dir=None):
+        """
+        Args:
+            callbacks (iterable): Funções chamadas com o registro (dict) de cada renderização.
+            profile_slowest (int): Guarda o perfil cProfile das N renderizações mais lentas
+                (0 desativa o cProfile, que tem custo considerável).
+            profile_dir (str, opcional): Diretório onde os perfis mais lentos são gravados
+                como arquivos .prof (abrir com pstats ou snakeviz).
+        """
+        self.callbacks = list(callbacks)
+        self.profile_slowest = profile_slowest
+        self.profile_dir = profile_dir
+        self._slowest = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        if profile_dir:
+            os.makedirs(profile_dir, exist_ok=True)
+
+    def add_callback(self, callback):
+        """Adiciona uma função a ser chamada com o registro de cada renderização."""
+        self.callbacks.append(callback)
+
+    @contextmanager
+    def trace(self, **context):
+        """
+        Mede uma renderização; o bloco recebe o RenderTrace a ser passado ao motor.
+
+        Ao final (mesmo em caso de erro), o registro é entregue aos callbacks.
+        Erros dos callbacks são ignorados, para não interromper a renderização.
+        Com renderizações simultâneas (threads), apenas uma de cada vez é perfilada.
+        """
+        trace = RenderTrace(**context)
+        profiler = None
+        if self.profile_slowest and _profiler_lock.acquire(blocking=False):
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # outro perfil ativo fora da instrumentação
+                profiler = None
+                _profiler_lock.release()
+        start = time.perf_counter()
+        try:
+            yield trace
+        except BaseException as e:
+            trace.set(erro=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                _profiler_lock.release()
+            seconds = time.perf_counter() - start
+            trace.set(segundos=round(seconds, 6))
+            trace.record = trace.to_dict()
+            if profiler is not None:
+                self._keep_profile(seconds, trace.record, profiler)
+            for callback in self.callbacks:
+                try:
+                    callback(trace.record)
+                except Exception:
+                    pass
+
+    def _keep_profile(self, seconds, record, profiler):
+        """Mantém o perfil se ele estiver entre os profile_slowest mais lentos."""
+        with self._lock:
+            if len(self._slowest) >= self.profile_slowest and seconds <= self._slowest[0][0]:
+                return
+            path = None
+            if self.profile_dir:
+                label = "-".join(str(record[key]) for key in sorted(record) if key in ("registro", "origem"))
+                path = os.path.join(self.profile_dir, f"{seconds:09.4f}s-{os.getpid()}-{next(self._counter)}{'-' + label if label else ''}.prof")
+                profiler.dump_stats(path)
+            entry = (seconds, next(self._counter), record, profiler, path)
+            if len(self._slowest) < self.profile_slowest:
+                heapq.heappush(self._slowest, entry)
+            else:
+                evicted = heapq.heapreplace(self._slowest, entry)
+                if evicted[4] and os.path.exists(evicted[4]):
+                    os.remove(evicted[4])
+
+    def slowest(self):
+        """
+        Retorna as renderizações mais lentas guardadas, da mais lenta para a mais rápida.
+
+        Returns:
+            list: Tuplas (segundos, registro, pstats.Stats).
+        """
+        with self._lock:
+            entries = sorted(self._slowest, reverse=True)
+        return [(seconds, record, pstats.Stats(profiler)) for seconds, _, record, profiler, _ in entries]
+
+
+def only_errors(callback):
+    """Envolve um callback para que ele receba apenas os registros de renderizações com erro."""
+    def wrapper(record):
+        if "erro" in record:
+            callback(record)
+    return wrapper
+
+
+class JsonLinesWriter:
+    """Callback que grava cada registro como uma linha JSON (arquivo ou stream de texto)."""
+
+    def __init__(self, target):
+        """
+        Args:
+            target (str | file): Caminho do arquivo (aberto em modo de acréscimo) ou stream de texto.
+        """
+        self._owns_stream = isinstance(target, (str, os.PathLike))
+        self.stream = open(target, "a", encoding="utf-8") if self._owns_stream else target
+        self._lock = threading.Lock()
+
+    def __call__(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.stream.write(line)
+            self.stream.flush()
+
+    def close(self):
+        """Fecha o arquivo, se ele foi aberto por este objeto."""
+        if self._owns_stream:
+            self.stream.close()
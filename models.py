@@ -0,0 +1,105 @@
+# ----- IMPORTAÇÕES -----
+from dataclasses import dataclass
+
+# Modelo de dados do currículo. Não depende do Tkinter nem do ReportLab, para que
+# a interface possa usá-lo sem carregar o motor de renderização.
+
+# ----- MODELO DE DADOS -----
+# Instantâneos imutáveis (frozen, com __slots__) dos dados do currículo: a
+# renderização lê apenas estes objetos, nunca os widgets.
+@dataclass(frozen=True, slots=True)
+class Experience:
+    """Uma experiência profissional, com os mesmos campos da aba Experiência."""
+    cargo: str = ""
+    empresa: str = ""
+    local: str = ""
+    data_inicio: str = ""
+    data_fim: str = ""
+    descricao: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        """Cria uma experiência a partir de um dicionário (ex.: registro JSON)."""
+        return cls(**{name: str(data.get(name) or "").strip() for name in cls.__dataclass_fields__})
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    """Uma formação acadêmica, com os mesmos campos da aba Educação."""
+    curso: str = ""
+    instituicao: str = ""
+    local_edu: str = ""
+    data_conclusao: str = ""
+    detalhes_edu: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        """Cria uma formação a partir de um dicionário (ex.: registro JSON)."""
+        return cls(**{name: str(data.get(name) or "").strip() for name in cls.__dataclass_fields__})
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    """Dados completos de um currículo, sem nenhuma dependência de widgets."""
+    nome_completo: str = ""
+    email: str = ""
+    telefone: str = ""
+    linkedin: str = ""
+    resumo: str = ""
+    experiencias: tuple = ()
+    educacao: tuple = ()
+    habilidades: str = ""
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Cria um currículo a partir de um dicionário com as chaves usadas pela UI.
+
+        Args:
+            data (dict): Dicionário com "nome_completo", "email", "experiencias", etc.
+
+        Returns:
+            Resume: O currículo correspondente.
+        """
+        scalars = {name: str(data.get(name) or "").strip()
+                   for name in ("nome_completo", "email", "telefone", "linkedin", "resumo", "habilidades")}
+        return cls(experiencias=tuple(Experience.from_dict(exp) for exp in data.get("experiencias") or ()),
+                   educacao=tuple(Education.from_dict(edu) for edu in data.get("educacao") or ()),
+                   **scalars)
+
+
+def split_skills(habilidades):
+    """Separa o texto de habilidades (vírgulas ou quebras de linha) em uma lista."""
+    return [s.strip() for s in habilidades.replace(',', '\n').split('\n') if s.strip()]
+
+
+def check_resume_dict(data):
+    """
+    Verifica se um dicionário (ex.: corpo JSON) tem o formato aceito por Resume.from_dict.
+
+    Os campos simples devem ser texto, número ou nulos; "experiencias" e "educacao",
+    listas de objetos com campos simples.
+
+    Raises:
+        ValueError: Com a descrição do primeiro campo inválido.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("O currículo deve ser um objeto.")
+    for name in ("nome_completo", "email", "telefone", "linkedin", "resumo", "habilidades"):
+        _check_scalar(data.get(name), name)
+    for name, model in (("experiencias", Experience), ("educacao", Education)):
+        items = data.get(name)
+        if items is None:
+            continue
+        if not isinstance(items, list):
+            raise ValueError(f'"{name}" deve ser uma lista.')
+        for number, item in enumerate(items):
+            if not isinstance(item, dict):
+                raise ValueError(f'"{name}[{number}]" deve ser um objeto.')
+            for field in model.__dataclass_fields__:
+                _check_scalar(item.get(field), f"{name}[{number}].{field}")
+
+
+def _check_scalar(value, name):
+    if value is not None and not isinstance(value, (str, int, float)):
+        raise ValueError(f'"{name}" deve ser texto.')
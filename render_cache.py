@@ -0,0 +1,197 @@
+# ----- IMPORTAÇÕES -----
+import contextlib
+import dataclasses
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from engine import TEMPLATE_VERSION, Resume, get_styles, render
+from fileio import atomic_write
+
+# Cache em disco de PDFs gerados, endereçado pelo conteúdo: a chave é o hash dos
+# dados normalizados do currículo mais a versão do layout/estilos. Uma nova
+# renderização de um currículo já gerado vira uma cópia de arquivo.
+#
+# Os arquivos são gravados de forma atômica (arquivo temporário + os.replace), de
+# modo que vários processos (ex.: os processos do modo em lote) podem compartilhar
+# o mesmo diretório com segurança.
+
+# Tempo após o qual uma trava de limpeza é considerada abandonada (segundos).
+EVICTION_LOCK_TIMEOUT = 300
+
+
+def cache_key(resume, font_family=None):
+    """
+    Calcula a chave de cache de um currículo.
+
+    Args:
+        resume (Resume | dict): Os dados do currículo.
+        font_family (str, opcional): Família de fontes usada na renderização.
+
+    Returns:
+        str: Hash SHA-256 (hexadecimal) dos dados normalizados e da versão do layout.
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    payload = {"versao": TEMPLATE_VERSION, "fonte": font_family, "dados": dataclasses.asdict(resume)}
+    encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """
+    Cache de PDFs em disco com remoção LRU pelo tamanho total.
+
+    O "uso recente" de cada arquivo é a sua data de modificação, atualizada a
+    cada acerto; quando o total ultrapassa max_bytes, os arquivos mais antigos
+    são removidos até o cache voltar a 90% do limite.
+    """
+
+    def __init__(self, directory, max_bytes=512 * 1024 * 1024, evict_every=64):
+        """
+        Args:
+            directory (str): Diretório do cache (criado se não existir).
+            max_bytes (int): Tamanho total máximo dos PDFs guardados.
+            evict_every (int): Verifica o tamanho do cache a cada evict_every gravações.
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.evict_every = evict_every
+        self.hits = 0
+        self.misses = 0
+        self._puts = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.pdf")
+
+    def get(self, key, out):
+        """
+        Copia o PDF guardado para out, se existir.
+
+        Args:
+            key (str): Chave calculada por cache_key.
+            out (str | file): Caminho de destino (gravado de forma atômica) ou objeto binário gravável.
+
+        Returns:
+            bool: True em caso de acerto.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if isinstance(out, (str, os.PathLike)):
+                    atomic_write(out, f.read())
+                else:
+                    shutil.copyfileobj(f, out)
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, key, data):
+        """Guarda o PDF (bytes) sob a chave key."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write(path, data)
+        with self._lock:
+            self._puts += 1
+            check = (self._puts - 1) % self.evict_every == 0
+        if check:
+            self.evict()
+
+    def evict(self):
+        """
+        Remove os PDFs usados há mais tempo até o cache caber em 90% de max_bytes.
+
+        Apenas um processo faz a limpeza de cada vez (trava em arquivo); os demais
+        simplesmente a ignoram.
+        """
+        lock_path = os.path.join(self.directory, "evict.lock")
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > EVICTION_LOCK_TIMEOUT:
+                    os.remove(lock_path)
+            except OSError:
+                pass
+            return
+        os.close(fd)
+        try:
+            entries = []
+            total = 0
+            for root, _, files in os.walk(self.directory):
+                for name in files:
+                    if not name.endswith(".pdf"):
+                        continue
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+                    total += stat.st_size
+            if total <= self.max_bytes:
+                return
+            target = self.max_bytes * 0.9
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                except OSError:
+                    pass
+        finally:
+            os.remove(lock_path)
+
+    def stats(self):
+        """Retorna os contadores de acertos e faltas deste processo."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+def render_cached(resume, out, cache, font_family=None, trace=None):
+    """
+    Gera o PDF do currículo, reaproveitando o cache em disco quando possível.
+
+    Args:
+        resume (Resume | dict): Os dados do currículo.
+        out (str | file): Caminho do arquivo ou objeto binário gravável.
+        cache (RenderCache): O cache em disco.
+        font_family (str, opcional): Família registrada com engine.register_font_family.
+        trace (RenderTrace, opcional): Recebe as fases "cache", "story", "layout" e "write".
+
+    Returns:
+        bool: True se o PDF veio do cache.
+    """
+    if isinstance(resume, dict):
+        resume = Resume.from_dict(resume)
+    key = cache_key(resume, font_family)
+    if trace is None:
+        hit = cache.get(key, out)
+    else:
+        with trace.phase("cache"):
+            hit = cache.get(key, out)
+        trace.set(cache=hit)
+    if hit:
+        return True
+
+    buffer = io.BytesIO()
+    render(resume, buffer, get_styles(font_family), trace=trace)
+    data = buffer.getvalue()
+    with trace.phase("write") if trace is not None else contextlib.nullcontext():
+        if isinstance(out, (str, os.PathLike)):
+            atomic_write(out, data)
+        else:
+            out.write(data)
+        cache.put(key, data)
+    return False
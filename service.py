@@ -0,0 +1,280 @@
+# ----- IMPORTAÇÕES -----
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from engine import Resume, get_styles, render
+from models import check_resume_dict
+
+# Serviço HTTP local de geração de currículos, apenas com a biblioteca padrão.
+#
+#   POST /render  corpo: JSON com os campos do currículo  ->  application/pdf
+#   GET  /health  ->  JSON com o estado do serviço
+#
+# A renderização é feita em um pool de processos. Quando o número de pedidos em
+# andamento atinge o limite da fila, novos pedidos recebem 429 (Too Many Requests).
+# Se um processo de trabalho morrer (ex.: falta de memória), o pool é recriado.
+
+# Tamanho máximo do corpo de um pedido (bytes).
+MAX_BODY_BYTES = 1024 * 1024
+# Tempo máximo para receber o cabeçalho e o corpo de um pedido (segundos).
+READ_TIMEOUT = 10
+# Tamanho dos blocos em que o PDF é enviado ao cliente.
+CHUNK_SIZE = 64 * 1024
+
+
+# ----- PROCESSOS DE TRABALHO -----
+def _init_worker():
+    """Prepara o registro de estilos uma única vez em cada processo de trabalho."""
+    get_styles()
+
+
+def _render_pdf(record):
+    """Gera o PDF de um currículo em memória (executado em um processo de trabalho)."""
+    buffer = io.BytesIO()
+    render(Resume.from_dict(record), buffer)
+    return buffer.getvalue()
+
+
+class HTTPError(Exception):
+    """Erro que deve ser respondido ao cliente com o status indicado."""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+# ----- SERVIÇO -----
+class RenderService:
+    """Servidor HTTP asyncio que distribui a geração de PDFs entre processos."""
+
+    def __init__(self, host="127.0.0.1", port=8000, workers=None, queue_size=None, timeout=30.0):
+        """
+        Args:
+            host (str): Endereço de escuta.
+            port (int): Porta de escuta (0 escolhe uma porta livre).
+            workers (int, opcional): Número de processos de geração; padrão: número de CPUs.
+            queue_size (int, opcional): Máximo de pedidos em andamento (em execução ou na
+                fila do pool); padrão: 4 por processo.
+            timeout (float): Tempo máximo, em segundos, para gerar cada PDF.
+        """
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = self._new_pool()
+        self.queue_size = queue_size or self.workers * 4
+        self.timeout = timeout
+        self.in_flight = 0
+        self.counts = {"ok": 0, "rejeitados": 0, "expirados": 0, "erros": 0, "pools_recriados": 0}
+        self.pool_error = None
+        self.server = None
+
+    def _new_pool(self):
+        """Cria o pool de processos de geração."""
+        # Com "fork", um processo criado durante um pedido herdaria o socket do cliente
+        # e a conexão não se encerraria ao ser fechada aqui; o forkserver cria os
+        # processos a partir de um processo limpo.
+        context = multiprocessing.get_context("forkserver") if "forkserver" in multiprocessing.get_all_start_methods() else None
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, mp_context=context)
+
+    def _replace_pool(self, pool, error):
+        """
+        Substitui um pool quebrado (um processo de trabalho morreu) por um novo.
+
+        Vários pedidos podem detectar a mesma falha; apenas o primeiro recria o pool.
+        """
+        if pool is not self.pool:
+            return
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.pool = self._new_pool()
+        self.counts["pools_recriados"] += 1
+        self.pool_error = f"{type(error).__name__}: {error}"
+
+    async def start(self):
+        """Abre o socket de escuta; a porta efetiva fica em self.port."""
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """Atende pedidos até ser cancelado."""
+        if self.server is None:
+            await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    # ----- PROTOCOLO HTTP -----
+    async def _read_request(self, reader):
+        """Lê a linha de pedido, os cabeçalhos e o corpo."""
+        request_line = await reader.readline()
+        if not request_line:
+            return None
+        try:
+            method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Linha de pedido inválida.")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length inválido.")
+        if length < 0:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length inválido.")
+        if length > MAX_BODY_BYTES:
+            raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"O corpo excede {MAX_BODY_BYTES} bytes.")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target.split("?", 1)[0], body
+
+    async def _send(self, writer, status, body=b"", content_type="application/json", headers=None):
+        """Envia a resposta em blocos, respeitando o ritmo de leitura do cliente."""
+        head = [f"HTTP/1.1 {status.value} {status.phrase}",
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}",
+                "Connection: close"]
+        head += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+        view = memoryview(body)
+        for start in range(0, len(body), CHUNK_SIZE):
+            writer.write(view[start:start + CHUNK_SIZE])
+            await writer.drain()
+        await writer.drain()
+
+    async def _send_json(self, writer, status, payload, headers=None):
+        await self._send(writer, status, json.dumps(payload, ensure_ascii=False).encode("utf-8"), headers=headers)
+
+    async def _handle(self, reader, writer):
+        """Atende uma conexão (um pedido por conexão)."""
+        try:
+            try:
+                request = await asyncio.wait_for(self._read_request(reader), READ_TIMEOUT)
+                if request is None:
+                    return
+                method, path, body = request
+                if path == "/health" and method == "GET":
+                    await self._send_json(writer, HTTPStatus.OK, self.health())
+                elif path == "/render" and method == "POST":
+                    pdf = await self._render(body)
+                    await self._send(writer, HTTPStatus.OK, pdf, "application/pdf")
+                elif path in ("/health", "/render"):
+                    raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Método não permitido.")
+                else:
+                    raise HTTPError(HTTPStatus.NOT_FOUND, "Recurso não encontrado.")
+            except HTTPError as e:
+                await self._send_json(writer, e.status, {"erro": str(e)}, e.headers)
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                await self._send_json(writer, HTTPStatus.REQUEST_TIMEOUT, {"erro": "Pedido incompleto."})
+            except ConnectionError:
+                raise
+            except Exception as e:
+                # Nenhum erro inesperado deve derrubar a conexão sem resposta.
+                self.counts["erros"] += 1
+                await self._send_json(writer, HTTPStatus.INTERNAL_SERVER_ERROR, {"erro": f"{type(e).__name__}: {e}"})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # ----- GERAÇÃO -----
+    async def _render(self, body):
+        """Valida o JSON e gera o PDF no pool, aplicando o limite da fila e o tempo máximo."""
+        try:
+            record = json.loads(body)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.BAD_REQUEST, f"JSON inválido: {e}")
+        if not isinstance(record, dict):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "O corpo deve ser um objeto JSON.")
+        try:
+            check_resume_dict(record)
+        except ValueError as e:
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, str(e))
+
+        if self.in_flight >= self.queue_size:
+            self.counts["rejeitados"] += 1
+            raise HTTPError(HTTPStatus.TOO_MANY_REQUESTS, "Fila cheia; tente novamente.", {"Retry-After": "1"})
+
+        # O pedido ocupa a fila até o processo terminar, mesmo que o cliente já tenha
+        # recebido 504: uma tarefa em execução no pool não pode ser interrompida.
+        future = self._submit(record)
+        self.in_flight += 1
+        future.add_done_callback(self._on_render_done)
+        pool = self.pool
+        try:
+            pdf = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.counts["expirados"] += 1
+            raise HTTPError(HTTPStatus.GATEWAY_TIMEOUT, f"A geração excedeu {self.timeout} s.")
+        except BrokenProcessPool as e:
+            # O processo morreu durante este pedido; ele não é repetido, pois pode ser a causa.
+            self.counts["erros"] += 1
+            self._replace_pool(pool, e)
+            raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, "O processo de geração foi encerrado inesperadamente.")
+        except ValueError as e:
+            # Dados que o ReportLab não consegue interpretar (ex.: marcação inválida)
+            self.counts["erros"] += 1
+            raise HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, f"{type(e).__name__}: {e}")
+        except Exception as e:
+            self.counts["erros"] += 1
+            raise HTTPError(HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(e).__name__}: {e}")
+        self.counts["ok"] += 1
+        return pdf
+
+    def _submit(self, record):
+        """
+        Envia o currículo ao pool e retorna o future asyncio.
+
+        Se o pool já estava quebrado (um processo morreu entre pedidos), ele é recriado
+        e o pedido é enviado ao novo pool.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        try:
+            return loop.run_in_executor(pool, _render_pdf, record)
+        except BrokenProcessPool as e:
+            self._replace_pool(pool, e)
+            return loop.run_in_executor(self.pool, _render_pdf, record)
+
+    def _on_render_done(self, future):
+        self.in_flight -= 1
+        if not future.cancelled():
+            future.exception()  # evita o aviso de exceção não recuperada após um 504
+
+    def health(self):
+        """
+        Retorna o estado do serviço (usado por GET /health).
+
+        "status" é "degradado" enquanto o pool estiver quebrado (um processo morreu e
+        o pool ainda não foi recriado); a última falha fica em "ultima_falha_pool".
+        """
+        broken = getattr(self.pool, "_broken", False)
+        return {"status": "degradado" if broken else "ok", "em_andamento": self.in_flight,
+                "limite_fila": self.queue_size, "processos": self.workers, **self.counts,
+                "ultima_falha_pool": broken or self.pool_error}
+
+
+def serve(host="127.0.0.1", port=8000, workers=None, queue_size=None, timeout=30.0):
+    """Inicia o serviço e atende pedidos até Ctrl+C."""
+    async def run():
+        service = RenderService(host, port, workers, queue_size, timeout)
+        await service.start()
+        print(f"Servindo em http://{service.host}:{service.port} (Ctrl+C para encerrar)")
+        await service.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
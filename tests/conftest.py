@@ -0,0 +1,6 @@
+# ----- IMPORTAÇÕES -----
+import os
+import sys
+
+# Os módulos do projeto ficam na raiz do repositório, sem pacote instalável.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
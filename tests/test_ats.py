@@ -0,0 +1,71 @@
+# ----- IMPORTAÇÕES -----
+from ats import PostingIndex, resume_terms, tokenize
+
+POSTINGS = [
+    {"id": "dados", "titulo": "Engenheiro de Dados", "descricao": "Buscamos dev para pipelines em Python e Spark.",
+     "palavras_chave": ["Python", "Apache Spark", "Gestão de Projetos"]},
+    {"id": "design", "titulo": "Designer", "descricao": "Figma, UX", "palavras_chave": "Figma, UX Research"},
+    {"id": "web", "titulo": "Desenvolvedor Web", "descricao": "React, Node.js e C++ para sistemas de alto desempenho."},
+]
+
+RESUME = {
+    "nome_completo": "Maria da Silva",
+    "resumo": "Engenheira de dados com experiência em gestao de projetos.",
+    "experiencias": [{"cargo": "Engenheiro de Dados", "descricao": "- Pipelines em Python"}],
+    "habilidades": "Python, SQL",
+}
+
+
+def index():
+    return PostingIndex.from_postings(POSTINGS)
+
+
+# ----- NORMALIZAÇÃO -----
+def test_tokenize_folds_accents_and_drops_stopwords():
+    assert tokenize("Gestão de Projetos em C++ e Node.js") == ["gestao", "projetos", "c++", "node.js"]
+
+
+def test_resume_terms_do_not_cross_skills():
+    terms = resume_terms({"habilidades": "Apache, Spark"}, max_n=2)
+    assert {"apache", "spark"} <= terms
+    assert "apache spark" not in terms
+
+
+# ----- COMPARAÇÃO -----
+def test_match_ranks_by_keyword_coverage():
+    matches = index().match(RESUME)
+    assert [m.id for m in matches] == ["dados"]
+    best = matches[0]
+    assert 0 < best.pontuacao < 1
+    # "gestao de projetos" (sem acento no currículo) casa com a palavra-chave acentuada.
+    assert "gestão de projetos" in best.presentes and "python" in best.presentes
+
+
+def test_match_lists_only_explicit_keywords_as_missing():
+    best = index().match(RESUME)[0]
+    assert best.ausentes == ("apache spark",)
+
+
+def test_match_lists_description_words_without_explicit_keywords():
+    matches = index().match({"habilidades": "React"})
+    assert matches[0].id == "web"
+    assert {"node.js", "c++"} <= set(matches[0].ausentes)
+
+
+def test_match_respects_top_and_missing():
+    postings = [{"id": str(n), "titulo": "Analista", "descricao": f"python sql tema{n}"} for n in range(20)]
+    matches = PostingIndex.from_postings(postings).match({"habilidades": "Python, tema7"}, top=3, missing=1)
+    assert [m.id for m in matches][0] == "7"
+    assert len(matches) == 3
+    assert all(len(m.ausentes) <= 1 for m in matches)
+
+
+def test_match_without_common_terms_is_empty():
+    assert index().match({"habilidades": "Cobol"}) == []
+
+
+def test_index_accepts_postings_after_matching():
+    postings = index()
+    postings.match(RESUME)
+    postings.add({"id": "cobol", "titulo": "Programador Cobol", "descricao": "Mainframe"})
+    assert [m.id for m in postings.match({"habilidades": "Cobol"})] == ["cobol"]
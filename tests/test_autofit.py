@@ -0,0 +1,50 @@
+# ----- IMPORTAÇÕES -----
+import io
+import random
+import pytest
+from autofit import count_pages, fit_to_pages, frame_size, scaled_styles
+from benchmark import synthetic_resume
+from engine import build_story, make_doc_template
+
+
+def built_pages(resume, styles):
+    """Número real de páginas, gerando o PDF com doc.build."""
+    doc = make_doc_template(io.BytesIO())
+    doc.build(build_story(resume, styles, cache=None))
+    return doc.page
+
+
+# ----- ESTIMATIVA DE PÁGINAS -----
+@pytest.mark.parametrize("seed", range(12))
+def test_count_pages_matches_build(seed):
+    rng = random.Random(seed)
+    resume = synthetic_resume(experiences=rng.randint(0, 12), bullets=rng.randint(1, 10),
+                              skills=rng.randint(0, 60), education=rng.randint(0, 4),
+                              unicode=rng.random() < 0.5, seed=seed)
+    styles = scaled_styles(rng.choice((0.7, 0.8, 0.85, 0.9, 1.0)))
+    width, height = frame_size()
+    assert count_pages(build_story(resume, styles, cache=None), width, height) == built_pages(resume, styles)
+
+
+def test_count_pages_empty_resume():
+    width, height = frame_size()
+    resume = synthetic_resume(experiences=0, bullets=0, skills=0, education=0)
+    assert count_pages(build_story(resume, scaled_styles(1.0), cache=None), width, height) == 1
+
+
+# ----- AJUSTE A N PÁGINAS -----
+def test_fit_to_pages_fits_in_one_page():
+    resume = synthetic_resume(experiences=4, bullets=5, skills=20, education=2)
+    assert built_pages(resume, scaled_styles(1.0)) > 1
+    result = fit_to_pages(resume, max_pages=1, min_scale=0.5)
+    assert result.fits and result.scale < 1.0
+    assert built_pages(resume, result.styles) == 1
+    # A escala seguinte (0,01 maior) já não cabe.
+    assert built_pages(resume, scaled_styles(round(result.scale + 0.01, 2))) > 1
+
+
+def test_fit_to_pages_reports_when_nothing_fits():
+    resume = synthetic_resume(experiences=40, bullets=10)
+    result = fit_to_pages(resume, max_pages=1)
+    assert not result.fits
+    assert result.scale == 0.7 and result.pages > 1
@@ -0,0 +1,18 @@
+# ----- IMPORTAÇÕES -----
+from batch import output_name
+
+
+# ----- NOMES DOS ARQUIVOS -----
+def test_output_name_uses_id_or_number():
+    assert output_name(7, {"id": "joão silva/01"}) == "joão_silva_01.pdf"
+    assert output_name(7, {"id": "  "}) == "000007.pdf"
+    assert output_name(7, {}) == "000007.pdf"
+
+
+def test_output_name_suffixes_duplicate_ids():
+    used = set()
+    names = [output_name(number, {"id": record_id}, used)
+             for number, record_id in enumerate(["joao", "joao", "JOAO", "joao-000002", "", "000005"], start=1)]
+    assert names == ["joao.pdf", "joao-000002.pdf", "JOAO-000003.pdf", "joao-000002-000004.pdf",
+                     "000005.pdf", "000005-000006.pdf"]
+    assert len({name.casefold() for name in names}) == len(names)
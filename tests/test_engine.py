@@ -0,0 +1,96 @@
+# ----- IMPORTAÇÕES -----
+import io
+import pytest
+from reportlab import rl_config
+from reportlab.platypus import Paragraph
+from autofit import scaled_styles
+from benchmark import synthetic_resume
+from engine import FlowableCache, build_story, get_styles, make_doc_template
+
+
+def paragraphs(text, styles):
+    return [Paragraph(text, styles["Normal"])]
+
+
+# ----- CACHE DE FLOWABLES -----
+def test_flowable_cache_hit_returns_fresh_copies():
+    cache = FlowableCache()
+    styles = get_styles()
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return paragraphs("Python, SQL", styles)
+
+    first = cache.get(("habilidades", "Python, SQL"), styles, builder)
+    second = cache.get(("habilidades", "Python, SQL"), styles, builder)
+    assert len(calls) == 1
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "maxsize": 512}
+    assert first[0] is not second[0]
+    assert first[0].frags is second[0].frags
+
+
+def test_flowable_cache_separates_style_sheets():
+    cache = FlowableCache()
+    for styles in (get_styles(), scaled_styles(0.8)):
+        cache.get(("titulo", "Resumo"), styles, lambda: paragraphs("Resumo", styles))
+    assert cache.stats()["misses"] == 2
+
+
+def test_flowable_cache_evicts_least_recently_used():
+    cache = FlowableCache(maxsize=2)
+    styles = get_styles()
+    built = []
+
+    def get(key):
+        cache.get(key, styles, lambda: built.append(key) or paragraphs(key, styles))
+
+    get("a")
+    get("b")
+    get("a")  # "a" passa a ser a mais recente
+    get("c")  # remove "b"
+    get("a")
+    get("b")
+    assert built == ["a", "b", "c", "b"]
+    assert cache.stats()["size"] == 2
+
+
+def test_cached_story_renders_same_pdf():
+    resume = synthetic_resume(experiences=5, unicode=True)
+    styles = get_styles()
+    cache = FlowableCache()
+
+    def pdf(cache):
+        buffer = io.BytesIO()
+        make_doc_template(buffer).build(build_story(resume, styles, cache=cache))
+        return buffer.getvalue()
+
+    invariant = rl_config.invariant
+    rl_config.invariant = 1
+    try:
+        uncached = pdf(None)
+        pdf(cache)
+        assert cache.stats()["hits"] == 0
+        assert pdf(cache) == uncached
+        assert cache.stats()["hits"] > 0
+    finally:
+        rl_config.invariant = invariant
+
+
+# ----- REGISTRO DE ESTILOS -----
+def test_shared_styles_are_read_only():
+    styles = get_styles()
+    with pytest.raises(AttributeError):
+        styles["CorpoTexto"].fontSize = 30
+    with pytest.raises(TypeError):
+        styles["CorpoTexto"] = styles["Detalhes"]
+    assert get_styles()["CorpoTexto"].fontSize == 10
+
+
+def test_cloned_style_is_mutable_and_independent():
+    base = get_styles()["BulletPoints"]
+    style = base.clone("BulletPoints", fontSize=14)
+    style.leading = 16
+    assert (style.fontSize, style.leading, style.leftIndent) == (14, 16, base.leftIndent)
+    assert (base.fontSize, base.leading) == (10, 12)
+    assert base.parent is get_styles()["CorpoTexto"]
@@ -0,0 +1,53 @@
+# ----- IMPORTAÇÕES -----
+import io
+import json
+import pytest
+from document import Block, Document
+from export import _education_details, iso_date, write_json_resume
+
+
+# ----- DATAS ISO 8601 -----
+@pytest.mark.parametrize("text, expected", [
+    ("03/2020", "2020-03"),
+    ("3/2020", "2020-03"),
+    ("2020-03", "2020-03"),
+    ("2020-03-15", "2020-03-15"),
+    ("mar/2020", "2020-03"),
+    ("Março de 2020", "2020-03"),
+    ("Sept 2019", "2019-09"),
+    ("2020", "2020"),
+    (" 12/1999 ", "1999-12"),
+])
+def test_iso_date_converts_common_formats(text, expected):
+    assert iso_date(text) == expected
+
+
+@pytest.mark.parametrize("text", ["", "Atual", "Presente", "13/2020", "2020-02-40", "xyz/2020", "verão 2020"])
+def test_iso_date_drops_unparseable_dates(text):
+    assert iso_date(text) == ""
+
+
+# ----- DETALHES DA FORMAÇÃO -----
+def test_education_details_splits_score_and_summary():
+    blocks = [Block("GPA 3.9\nTCC sobre redes neurais"), Block("Média 8,5"), Block("Coeficiente: 9.1/10")]
+    assert _education_details(blocks) == {"score": "GPA 3.9; Média 8,5; Coeficiente: 9.1/10",
+                                          "summary": "TCC sobre redes neurais"}
+
+
+def test_education_details_without_score():
+    assert _education_details([Block("Monitor de cálculo")]) == {"score": "", "summary": "Monitor de cálculo"}
+
+
+# ----- JSON RESUME -----
+def test_json_resume_uses_iso_dates_and_omits_unparseable():
+    document = Document.from_resume({
+        "nome_completo": "Maria",
+        "experiencias": [{"cargo": "Dev", "data_inicio": "01/2018", "data_fim": "Atual"}],
+        "educacao": [{"curso": "Computação", "data_conclusao": "12/2017", "detalhes_edu": "CR 8.7\nIniciação científica"}],
+    })
+    out = io.BytesIO()
+    write_json_resume(document, out)
+    data = json.loads(out.getvalue())
+    assert data["work"][0]["startDate"] == "2018-01" and "endDate" not in data["work"][0]
+    education = data["education"][0]
+    assert (education["endDate"], education["score"], education["summary"]) == ("2017-12", "CR 8.7", "Iniciação científica")
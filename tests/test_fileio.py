@@ -0,0 +1,32 @@
+# ----- IMPORTAÇÕES -----
+import csv
+import json
+from fileio import iter_records
+
+GOOD = json.dumps({"nome_completo": "Maria"}).encode()
+
+
+# ----- LEITURA DOS REGISTROS -----
+def test_jsonl_bad_records_do_not_stop_reading(tmp_path):
+    path = tmp_path / "in.jsonl"
+    path.write_bytes(GOOD + b"\n\n{\n" + b'{"nome_completo": "\xff"}\n' + b"[1]\n" + GOOD + b"\n")
+    records = list(iter_records(str(path)))
+    assert [(number, record is not None) for number, record, _ in records] == [
+        (1, True), (2, False), (3, False), (4, False), (5, True)]
+    assert records[2][2].startswith("UTF-8 inválido")
+
+
+def test_csv_bad_rows_do_not_stop_reading(tmp_path):
+    path = tmp_path / "in.csv"
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["nome_completo", "resumo", "experiencias"])
+        writer.writerow(["A", "x" * 200_000, json.dumps([{"cargo": "Dev"}])])
+        writer.writerow(["B", "", "[inválido"])
+        writer.writerow(["C", "", ""])
+    path.write_bytes(path.read_bytes() + b"D\xfe,,\r\nE,,\r\n")
+    records = list(iter_records(str(path)))
+    assert [(number, record is not None) for number, record, _ in records] == [
+        (1, True), (2, False), (3, True), (4, False), (5, True)]
+    assert records[0][1]["experiencias"] == [{"cargo": "Dev"}]
+    assert records[3][2].startswith("UTF-8 inválido")
@@ -0,0 +1,33 @@
+# ----- IMPORTAÇÕES -----
+import re
+import pytest
+from models import Resume, check_resume_dict, split_skills
+
+
+# ----- VALIDAÇÃO DO FORMATO -----
+def test_check_resume_dict_accepts_valid_and_partial_records():
+    check_resume_dict({})
+    check_resume_dict({"nome_completo": "Maria", "telefone": 11999990000, "resumo": None,
+                       "experiencias": [{"cargo": "Dev", "descricao": "- Python"}], "educacao": []})
+
+
+@pytest.mark.parametrize("data, message", [
+    ([], "deve ser um objeto"),
+    ({"experiencias": 5}, '"experiencias" deve ser uma lista'),
+    ({"educacao": {"curso": "X"}}, '"educacao" deve ser uma lista'),
+    ({"experiencias": ["Dev"]}, '"experiencias[0]" deve ser um objeto'),
+    ({"experiencias": [{}, {"cargo": ["Dev"]}]}, '"experiencias[1].cargo" deve ser texto'),
+    ({"nome_completo": {"primeiro": "Maria"}}, '"nome_completo" deve ser texto'),
+    ({"habilidades": ["Python", "SQL"]}, '"habilidades" deve ser texto'),
+])
+def test_check_resume_dict_rejects_malformed_shapes(data, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        check_resume_dict(data)
+
+
+def test_checked_record_builds_resume():
+    data = {"nome_completo": "Maria", "experiencias": [{"cargo": "Dev"}], "habilidades": "Python, SQL"}
+    check_resume_dict(data)
+    resume = Resume.from_dict(data)
+    assert resume.experiencias[0].cargo == "Dev"
+    assert split_skills(resume.habilidades) == ["Python", "SQL"]
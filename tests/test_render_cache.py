@@ -0,0 +1,68 @@
+# ----- IMPORTAÇÕES -----
+import io
+import os
+from benchmark import synthetic_resume
+from render_cache import RenderCache, cache_key, render_cached
+
+
+def cached_keys(cache):
+    return {name[:-4] for _, _, files in os.walk(cache.directory) for name in files if name.endswith(".pdf")}
+
+
+# ----- CHAVES -----
+def test_cache_key_depends_on_content_and_font():
+    resume = synthetic_resume(seed=1)
+    assert cache_key(resume) == cache_key(synthetic_resume(seed=1))
+    assert cache_key(resume) != cache_key(synthetic_resume(seed=2))
+    assert cache_key(resume) != cache_key(resume, font_family="DejaVuSans")
+
+
+# ----- ACERTOS E REMOÇÃO -----
+def test_render_cached_hit_copies_pdf(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"))
+    resume = synthetic_resume(seed=3)
+    first, second = tmp_path / "a.pdf", io.BytesIO()
+    assert render_cached(resume, str(first), cache) is False
+    assert render_cached(resume, second, cache) is True
+    assert second.getvalue() == first.read_bytes()
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=1000, evict_every=1000)
+    keys = [f"{n:02d}" * 32 for n in range(5)]
+    for age, key in enumerate(keys):
+        cache.put(key, b"x" * 300)
+        os.utime(cache._path(key), (1_000_000 + age, 1_000_000 + age))
+    # Um acerto atualiza a data da entrada mais antiga.
+    assert cache.get(keys[0], io.BytesIO())
+
+    cache.evict()
+    # 1500 bytes > 1000: removidas as mais antigas até caber em 900 bytes.
+    assert cached_keys(cache) == {keys[0], keys[3], keys[4]}
+    assert not os.path.exists(os.path.join(cache.directory, "evict.lock"))
+
+
+def test_evict_keeps_cache_under_limit(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=1000)
+    for key in ("aa" * 32, "bb" * 32):
+        cache.put(key, b"x" * 300)
+    cache.evict()
+    assert len(cached_keys(cache)) == 2
+
+
+def test_put_evicts_periodically(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=1000, evict_every=2)
+    for n in range(7):
+        cache.put(f"{n:02d}" * 32, b"x" * 300)
+    # Limpeza na 1.ª, 3.ª, 5.ª e 7.ª gravação.
+    assert len(cached_keys(cache)) <= 4
+
+
+def test_evict_skips_when_another_process_holds_lock(tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=1000, evict_every=1000)
+    cache.put("aa" * 32, b"x" * 300)
+    cache.max_bytes = 100
+    open(os.path.join(cache.directory, "evict.lock"), "w").close()
+    cache.evict()
+    assert cached_keys(cache) == {"aa" * 32}
@@ -0,0 +1,53 @@
+# ----- IMPORTAÇÕES -----
+import asyncio
+import json
+from http import HTTPStatus
+import pytest
+from service import HTTPError, RenderService
+
+
+@pytest.fixture
+def service():
+    service = RenderService(workers=1)
+    yield service
+    service.pool.shutdown()
+
+
+def read_request(service, data):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await service._read_request(reader)
+    return asyncio.run(run())
+
+
+# ----- LEITURA DO PEDIDO -----
+def test_read_request_returns_method_path_and_body(service):
+    request = read_request(service, b"post /render?x=1 HTTP/1.1\r\nContent-Length: 2\r\n\r\n{}")
+    assert request == ("POST", "/render", b"{}")
+
+
+@pytest.mark.parametrize("length, status", [
+    ("-1", HTTPStatus.BAD_REQUEST),
+    ("abc", HTTPStatus.BAD_REQUEST),
+    (str(10 ** 9), HTTPStatus.REQUEST_ENTITY_TOO_LARGE),
+])
+def test_read_request_rejects_bad_content_length(service, length, status):
+    with pytest.raises(HTTPError) as error:
+        read_request(service, f"POST /render HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+    assert error.value.status == status
+
+
+# ----- VALIDAÇÃO ANTES DO POOL -----
+@pytest.mark.parametrize("body, status", [
+    (b"{", HTTPStatus.BAD_REQUEST),
+    (b"[]", HTTPStatus.BAD_REQUEST),
+    (json.dumps({"experiencias": 5}).encode(), HTTPStatus.UNPROCESSABLE_ENTITY),
+    (json.dumps({"educacao": [{"curso": {"nome": "X"}}]}).encode(), HTTPStatus.UNPROCESSABLE_ENTITY),
+])
+def test_render_rejects_invalid_body_without_using_pool(service, body, status):
+    with pytest.raises(HTTPError) as error:
+        asyncio.run(service._render(body))
+    assert error.value.status == status
+    assert service.in_flight == 0